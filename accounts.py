@@ -0,0 +1,148 @@
+import asyncio
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from dotenv import load_dotenv
+from eth_account import Account
+from ui import logger_error
+
+# Load environment variables from .env file
+load_dotenv()
+
+class AccountRecord:
+    __slots__ = ("private_key", "address", "xion_address", "babylon_address")
+
+    def __init__(self, private_key: bytes, xion_address: str, babylon_address: str, address=None) -> None:
+        self.private_key = private_key
+        self.xion_address = xion_address
+        self.babylon_address = babylon_address
+        self.address = address
+
+def parse_private_key(value: str):
+    value = value.strip()
+    if value.startswith("0x"):
+        value = value[2:]
+    if len(value) != 64:
+        raise ValueError("Private Key Must Be 32 Bytes Of Hex")
+    return bytes.fromhex(value)
+
+def validate_record(private_key: str, xion_address: str, babylon_address: str):
+    if not private_key or not xion_address or not babylon_address:
+        raise ValueError("Missing private_key, xion_address or babylon_address")
+    xion_address = xion_address.strip()
+    babylon_address = babylon_address.strip()
+    if not xion_address.startswith("xion1"):
+        raise ValueError(f"Invalid Xion Address {xion_address}")
+    if not babylon_address.startswith("bbn1"):
+        raise ValueError(f"Invalid Babylon Address {babylon_address}")
+    return AccountRecord(parse_private_key(private_key), xion_address, babylon_address)
+
+def read_rows(path: str):
+    with open(path, newline="", encoding="utf-8") as file:
+        if path.endswith(".jsonl"):
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(file)
+
+def read_records(path: str):
+    for line, row in enumerate(read_rows(path), start=1):
+        try:
+            yield validate_record(row.get("private_key"), row.get("xion_address"), row.get("babylon_address"))
+        except Exception as e:
+            logger_error(f"Invalid Account Data At Record {line}: {str(e)}")
+
+def read_env_records():
+    try:
+        yield validate_record(os.getenv("PRIVATE_KEY"), os.getenv("XION_ADDRESS"), os.getenv("BABYLON_ADDRESS"))
+    except Exception as e:
+        logger_error(f"Invalid Account Data In .env: {str(e)}")
+
+def derive_address(private_key: bytes):
+    try:
+        return Account.from_key(private_key).address
+    except Exception:
+        return None
+
+def iter_accounts(path=None, workers=None, chunk_size=5000, first_chunk=64):
+    records = read_records(path) if path else read_env_records()
+    workers = workers or os.cpu_count() or 1
+    size = min(first_chunk, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            chunk = list(islice(records, size))
+            if not chunk:
+                break
+            size = min(size * 2, chunk_size)
+            keys = [record.private_key for record in chunk]
+            if len(chunk) < 64:
+                addresses = map(derive_address, keys)
+            else:
+                addresses = executor.map(derive_address, keys, chunksize=max(1, len(chunk) // (workers * 4)))
+            for record, address in zip(chunk, addresses):
+                if not address:
+                    logger_error("Invalid Private Key or Library Version Not Supported")
+                    continue
+                record.address = address
+                yield record
+
+def load_accounts(path=None, workers=None):
+    return list(iter_accounts(path, workers))
+
+class AccountFeed:
+    def __init__(self, accounts, lanes: int, chunk_size=256, on_chunk=None) -> None:
+        self.accounts = iter(accounts)
+        self.chunk_size = chunk_size
+        self.on_chunk = on_chunk
+        self.loaded = []
+        self.start = 0
+        self.cursors = [0] * lanes
+        self.total = 0
+        self.exhausted = False
+        self.task = None
+
+    def read_chunk(self):
+        return list(islice(self.accounts, self.chunk_size))
+
+    async def fill(self):
+        try:
+            chunk = await asyncio.get_running_loop().run_in_executor(None, self.read_chunk)
+        except Exception as e:
+            logger_error(f"Reading Accounts Failed: {str(e)}")
+            chunk = []
+        if not chunk:
+            self.exhausted = True
+            return
+        if self.on_chunk:
+            await self.on_chunk(chunk)
+        self.loaded.extend(chunk)
+        self.total += len(chunk)
+
+    async def load(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.fill())
+        await asyncio.shield(self.task)
+
+    def trim(self):
+        drop = min(self.cursors) - self.start
+        if drop >= self.chunk_size:
+            del self.loaded[:drop]
+            self.start += drop
+
+    async def next(self, lane: int):
+        while True:
+            index = self.cursors[lane]
+            end = self.start + len(self.loaded)
+            if index < end:
+                self.cursors[lane] = index + 1
+                account = self.loaded[index - self.start]
+                if end - index <= self.chunk_size // 2 and not self.exhausted and (self.task is None or self.task.done()):
+                    self.task = asyncio.create_task(self.fill())
+                self.trim()
+                return index + 1, account
+            if self.exhausted:
+                return None
+            await self.load()
@@ -0,0 +1,38 @@
+import csv
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from accounts import iter_accounts
+
+def write_accounts(path: str, count: int):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["private_key", "xion_address", "babylon_address"])
+        for index in range(count):
+            writer.writerow([
+                "0x" + os.urandom(32).hex(),
+                f"xion1{index:038d}",
+                f"bbn1{index:038d}",
+            ])
+
+def main(count=100000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "accounts.csv")
+        write_accounts(path, count)
+        start = time.perf_counter()
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        accounts = list(iter_accounts(path))
+        elapsed = time.perf_counter() - start
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"accounts   {len(accounts):>8}")
+        print(f"load time  {elapsed:8.2f} s  ({len(accounts) / elapsed:,.0f} accounts/s)")
+        print(f"max rss    {after / 1024:8.1f} MiB  (+{(after - before) / 1024:.1f} MiB while loading)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,295 @@
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import rlp
+from aiohttp import web
+from eth_utils import keccak
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from accounts import load_accounts
+from stats import percentile
+from ui import log_sink
+from union import Union
+
+CHAIN_IDS = {"sepolia": 11155111, "holesky": 17000, "sei": 1328, "corn": 21000001}
+
+class MockChain:
+    def __init__(self, key: str, chain_id: int, block_time: float, latency: float, error_rate: float, broadcasts: dict) -> None:
+        self.key = key
+        self.chain_id = chain_id
+        self.block_time = block_time
+        self.latency = latency
+        self.error_rate = error_rate
+        self.broadcasts = broadcasts
+        self.min_priority_fee = 0
+        self.started_at = time.monotonic()
+        self.included = {}
+        self.calls = Counter()
+        self.http_requests = 0
+        self.runner = None
+        self.url = None
+
+    @property
+    def block_number(self):
+        return 1000 + int((time.monotonic() - self.started_at) / self.block_time)
+
+    def receipt(self, tx_hash: str):
+        block_number = self.included.get(tx_hash)
+        if block_number is None or block_number > self.block_number:
+            return None
+        return {
+            "transactionHash": tx_hash,
+            "blockNumber": hex(block_number),
+            "blockHash": "0x" + keccak(text=str(block_number)).hex(),
+            "status": "0x1",
+            "gasUsed": hex(150000),
+            "cumulativeGasUsed": hex(150000),
+            "effectiveGasPrice": hex(2 * 10**9),
+            "transactionIndex": "0x0",
+            "logs": [],
+        }
+
+    def result(self, method: str, params: list):
+        if method == "eth_chainId":
+            return hex(self.chain_id)
+        if method == "eth_blockNumber":
+            return hex(self.block_number)
+        if method == "eth_getBlockByNumber":
+            number = self.block_number
+            return {"number": hex(number), "hash": "0x" + keccak(text=str(number)).hex(), "timestamp": hex(int(time.time())), "baseFeePerGas": hex(10**9), "transactions": []}
+        if method == "eth_getBalance":
+            return hex(1000 * 10**18)
+        if method == "eth_getTransactionCount":
+            return "0x0"
+        if method == "eth_call":
+            return "0x"
+        if method == "eth_estimateGas":
+            return hex(200000)
+        if method == "eth_sendRawTransaction":
+            raw_tx = bytes.fromhex(params[0][2:])
+            tx_hash = "0x" + keccak(raw_tx).hex()
+            if int.from_bytes(rlp.decode(raw_tx[1:])[2], "big") < self.min_priority_fee:
+                return tx_hash
+            self.included[tx_hash] = self.block_number + 1
+            self.broadcasts[tx_hash] = time.monotonic()
+            return tx_hash
+        if method == "eth_getTransactionReceipt":
+            return self.receipt(params[0])
+        if method == "eth_getTransactionByHash":
+            return {"hash": params[0]} if params[0] in self.included else None
+        raise KeyError(method)
+
+    def reply(self, request: dict, inject: bool):
+        method = request.get("method")
+        self.calls[method] += 1
+        if inject and self.error_rate and random.random() < self.error_rate:
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": -32000, "message": "injected error"}}
+        try:
+            return {"jsonrpc": "2.0", "id": request.get("id"), "result": self.result(method, request.get("params") or [])}
+        except KeyError:
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": -32601, "message": f"method {method} not found"}}
+
+    async def handle(self, request):
+        self.http_requests += 1
+        body = await request.json()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if isinstance(body, list):
+            return web.json_response([self.reply(item, False) for item in body])
+        return web.json_response(self.reply(body, body.get("method") not in ("eth_chainId", "eth_blockNumber")))
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        self.url = f"http://127.0.0.1:{self.runner.addresses[0][1]}/"
+
+    async def close(self):
+        await self.runner.cleanup()
+
+class MockGraphQL:
+    def __init__(self, broadcasts: dict, index_delay: float, latency: float) -> None:
+        self.broadcasts = broadcasts
+        self.index_delay = index_delay
+        self.latency = latency
+        self.requests = 0
+        self.lookups = 0
+        self.runner = None
+        self.url = None
+
+    async def handle(self, request):
+        self.requests += 1
+        body = await request.json()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        now = time.monotonic()
+        data = {}
+        for name, tx_hash in body.get("variables", {}).items():
+            self.lookups += 1
+            sent_at = self.broadcasts.get(tx_hash)
+            ready = sent_at is not None and now - sent_at >= self.index_delay
+            data["t" + name[1:]] = [{"packet_hash": "0x" + keccak(text=tx_hash).hex()}] if ready else []
+        return web.json_response({"data": data})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        self.url = f"http://127.0.0.1:{self.runner.addresses[0][1]}/"
+
+    async def close(self):
+        await self.runner.cleanup()
+
+def write_accounts(path: str, count: int):
+    rng = random.Random(count)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["private_key", "xion_address", "babylon_address"])
+        for index in range(count):
+            writer.writerow(["0x%064x" % rng.getrandbits(256), f"xion1{index:038d}", f"bbn1{index:038d}"])
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip() or None
+    except Exception:
+        return None
+
+def format_latency(values):
+    if not values:
+        return "-"
+    return f"p50 {percentile(values, 0.5):6.2f} s  p95 {percentile(values, 0.95):6.2f} s"
+
+async def run(args):
+    random.seed(args.seed)
+    broadcasts = {}
+    chains = {key: MockChain(key, chain_id, args.block_time, args.latency, args.error_rate, broadcasts) for key, chain_id in CHAIN_IDS.items()}
+    graphql = MockGraphQL(broadcasts, args.index_delay, args.latency)
+    for chain in chains.values():
+        chain.min_priority_fee = int(args.min_priority_fee * 10**9)
+    for server in (*chains.values(), graphql):
+        await server.start()
+
+    with tempfile.TemporaryDirectory() as directory:
+        accounts_file = os.path.join(directory, "accounts.csv")
+        write_accounts(accounts_file, args.accounts)
+        log_sink.configure(log_file=os.path.join(directory, "logs.jsonl"), terminal=False)
+        accounts = load_accounts(accounts_file)
+
+        bot = Union()
+        bot.tx_count = args.transfers
+        bot.max_concurrency = args.concurrency
+        bot.max_pending_txs = args.max_pending
+        bot.min_delay = bot.max_delay = 0
+        bot.dry_run = args.dry_run
+        bot.burst = args.burst
+        bot.wait_for_receipt = not args.no_wait_receipt
+        bot.journal.path = os.path.join(directory, "journal.jsonl")
+        bot.packet_tracker.results_file = os.path.join(directory, "packets.jsonl")
+        bot.packet_resolver.api_url = graphql.url
+        for key, chain in bot.routes.chains.items():
+            chain.rpc_urls = [chains[key].url]
+        option = args.option or bot.routes.all_option
+
+        start = time.perf_counter()
+        try:
+            await bot.process_accounts_concurrently(accounts, option)
+        finally:
+            elapsed = time.perf_counter() - start
+            await bot.close()
+            log_sink.flush()
+        for server in (*chains.values(), graphql):
+            await server.close()
+
+    stats = bot.stats
+    confirm_latency = [value for chain in stats.chains.values() for value in chain.confirm_latency]
+    index_latency = [value for chain in stats.chains.values() for value in chain.index_latency]
+    calls = Counter()
+    for chain in chains.values():
+        calls.update(chain.calls)
+    result = {
+        "revision": git_revision(),
+        "accounts": args.accounts,
+        "transfers": args.transfers,
+        "option": option,
+        "concurrency": args.concurrency,
+        "max_pending": args.max_pending,
+        "burst": args.burst,
+        "no_wait_receipt": args.no_wait_receipt,
+        "block_time": args.block_time,
+        "latency": args.latency,
+        "error_rate": args.error_rate,
+        "min_priority_fee": args.min_priority_fee,
+        "elapsed": round(elapsed, 3),
+        "sent": sum(chain.sent for chain in stats.chains.values()),
+        "confirmed": sum(chain.confirmed for chain in stats.chains.values()),
+        "indexed": sum(chain.indexed for chain in stats.chains.values()),
+        "errors": sum(chain.errors for chain in stats.chains.values()),
+        "replaced": sum(chain.replaced for chain in stats.chains.values()),
+        "confirm_p50": percentile(confirm_latency, 0.5),
+        "confirm_p95": percentile(confirm_latency, 0.95),
+        "index_p50": percentile(index_latency, 0.5),
+        "index_p95": percentile(index_latency, 0.95),
+        "rpc_http_requests": sum(chain.http_requests for chain in chains.values()),
+        "rpc_calls": dict(sorted(calls.items())),
+        "graphql_requests": graphql.requests,
+        "graphql_lookups": graphql.lookups,
+        "max_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+    result["tx_per_second"] = round(result["confirmed"] / elapsed, 3) if elapsed else 0.0
+
+    print(f"revision       {result['revision']}")
+    print(f"workload       {args.accounts} accounts x {args.transfers} transfers, option {option}, concurrency {args.concurrency}")
+    print(f"mock chains    block {args.block_time} s, latency {args.latency * 1000:.0f} ms, errors {args.error_rate:.1%}")
+    print(f"elapsed        {elapsed:8.2f} s")
+    print(f"throughput     {result['tx_per_second']:8.2f} tx/s  (sent {result['sent']}, confirmed {result['confirmed']}, indexed {result['indexed']}, replaced {result['replaced']}, errors {result['errors']})")
+    print(f"confirm        {format_latency(confirm_latency)}")
+    print(f"index          {format_latency(index_latency)}")
+    print(f"rpc requests   {result['rpc_http_requests']:8} http  {sum(calls.values()):8} calls")
+    for method, count in result["rpc_calls"].items():
+        print(f"  {method:<28} {count:8}")
+    print(f"graphql        {graphql.requests:8} http  {graphql.lookups:8} lookups")
+    print(f"max rss        {result['max_rss_mib']:8.1f} MiB")
+    if args.dry_run:
+        bot.simulation.print_summary(bot.metrics, bot.routes, elapsed)
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as file:
+            file.write(json.dumps(result) + "\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Union end to end against local mock RPC and GraphQL servers.")
+    parser.add_argument("--accounts", type=int, default=10)
+    parser.add_argument("--transfers", type=int, default=1)
+    parser.add_argument("--option", type=int, default=None, help="route option from the menu, defaults to all routes")
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--max-pending", type=int, default=1, help="unconfirmed transfers allowed per account and chain")
+    parser.add_argument("--block-time", type=float, default=1.0)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every mock request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of single RPC calls answered with an error")
+    parser.add_argument("--min-priority-fee", type=float, default=0.0, help="gwei, transactions with a lower tip stay in the mock mempool until replaced")
+    parser.add_argument("--index-delay", type=float, default=2.0, help="seconds before a packet hash is returned")
+    parser.add_argument("--dry-run", action="store_true", help="simulate and sign without broadcasting")
+    parser.add_argument("--burst", action="store_true", help="pre-sign each account's transfers and broadcast them in one batch")
+    parser.add_argument("--no-wait-receipt", action="store_true", help="move on once a transfer is broadcast and confirm it in the background")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="append the result as a JSON line to this file")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from encoder import OperandEncoder
+from routes import RouteRegistry
+
+BASE_TOKEN_ADDRESS = "0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee"
+SENDER = "0x1234567890AbcdEF1234567890aBcdef12345678"
+RECEIVERS = {
+    "evm": SENDER,
+    "xion": "xion1qyqszqgpqyqszqgpqyqszqgpqyqszqgp2k9w3c",
+    "babylon": "bbn1qyqszqgpqyqszqgpqyqszqgpqyqszqgpxyz123",
+}
+
+def run(label, encode, routes, iterations):
+    start = time.perf_counter()
+    for amount in range(iterations):
+        for route in routes:
+            encode(route, amount, SENDER, RECEIVERS[route.receiver])
+    elapsed = time.perf_counter() - start
+    total = iterations * len(routes)
+    print(f"{label:<10} {total:>8} operands  {elapsed:8.3f} s  {total / elapsed:12,.0f} ops/s  {elapsed / total * 1e6:8.2f} us/op")
+
+def main(iterations=20000):
+    routes = RouteRegistry.load()
+    encoder = OperandEncoder(BASE_TOKEN_ADDRESS)
+
+    def cold(route, amount, sender, receiver):
+        encoder.templates.clear()
+        return encoder.encode(route, amount, sender, receiver)
+
+    run("cold", cold, routes, iterations // 10)
+    run("cached", encoder.encode, routes, iterations)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,62 @@
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from eth_account import Account
+from signer import BACKEND, Signer, sign_transaction
+
+ROUTER = "0x5FbE74A283f7954f10AA04C2eDf55578811aeb03"
+
+def build_transactions(count: int):
+    keys = [os.urandom(32) for _ in range(16)]
+    transactions = []
+    for index in range(count):
+        transactions.append(({
+            "to": ROUTER,
+            "value": 10**14,
+            "gas": 300000,
+            "maxFeePerGas": 3 * 10**9,
+            "maxPriorityFeePerGas": 10**9,
+            "nonce": index,
+            "chainId": 11155111,
+            "data": "0x" + os.urandom(900).hex(),
+        }, keys[index % len(keys)]))
+    return transactions
+
+def report(label: str, count: int, elapsed: float):
+    print(f"{label:<28} {count:>7} txs  {elapsed:8.3f} s  {count / elapsed:10,.0f} sig/s")
+
+def run_eth_account(transactions: list):
+    start = time.perf_counter()
+    results = [Account.sign_transaction(transaction, key) for transaction, key in transactions]
+    report("eth_account in loop", len(results), time.perf_counter() - start)
+    return [bytes(signed.hash) for signed in results]
+
+def run_inline(transactions: list):
+    start = time.perf_counter()
+    results = [sign_transaction(transaction, key) for transaction, key in transactions]
+    report(f"signer inline ({BACKEND})", len(results), time.perf_counter() - start)
+    return [tx_hash for _, tx_hash in results]
+
+async def run_pool(transactions: list, workers: int):
+    signer = Signer(workers=workers)
+    await asyncio.gather(*(signer.sign(transaction, key) for transaction, key in transactions[:workers * 4]))
+    start = time.perf_counter()
+    results = await asyncio.gather(*(signer.sign(transaction, key) for transaction, key in transactions))
+    report(f"signer pool x{workers} ({BACKEND})", len(results), time.perf_counter() - start)
+    signer.close()
+    return [tx_hash for _, tx_hash in results]
+
+def main(count=2000):
+    transactions = build_transactions(count)
+    expected = run_eth_account(transactions)
+    assert run_inline(transactions) == expected
+    workers = max(2, os.cpu_count() or 1)
+    assert asyncio.run(run_pool(transactions, workers)) == expected
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,66 @@
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from e2e import MockChain, write_accounts
+
+class FirstRequestChain(MockChain):
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.first_request = asyncio.Event()
+
+    async def handle(self, request):
+        self.first_request.set()
+        return await super().handle(request)
+
+def time_command(args: list, runs: int):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+async def time_to_first_rpc(directory: str, runs: int):
+    accounts_file = os.path.join(directory, "accounts.csv")
+    write_accounts(accounts_file, 1)
+    samples = []
+    for _ in range(runs):
+        chain = FirstRequestChain("sepolia", 11155111, 1.0, 0.0, 0.0, {})
+        await chain.start()
+        env = dict(os.environ, SEPOLIA_RPC_URLS=chain.url, LOG_TERMINAL="0", LOG_FILE=os.path.join(directory, "logs.jsonl"))
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(ROOT / "main.py"), "--route", "1", "--tx-count", "1", "--accounts-file", accounts_file,
+            cwd=directory, env=env, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            await asyncio.wait_for(chain.first_request.wait(), timeout=60)
+            samples.append(time.perf_counter() - start)
+        finally:
+            process.kill()
+            await process.wait()
+            await chain.close()
+    return samples
+
+def report(label: str, samples: list):
+    print(f"{label:<28} median {statistics.median(samples):6.3f} s  min {min(samples):6.3f} s  max {max(samples):6.3f} s")
+
+def main(runs=5):
+    report("python -c pass", time_command([sys.executable, "-c", "pass"], runs))
+    report("import main", time_command([sys.executable, "-c", "import main"], runs))
+    report("main.py --help", time_command([sys.executable, "main.py", "--help"], runs))
+    report("import union", time_command([sys.executable, "-c", "import union"], runs))
+    with tempfile.TemporaryDirectory() as directory:
+        report("headless to first rpc", asyncio.run(time_to_first_rpc(directory, runs)))
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,55 @@
+import time
+from rich.console import Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+from stats import percentile
+from ui import get_console
+from utils import format_seconds
+
+def format_latency(values):
+    p50 = percentile(values, 0.5)
+    p95 = percentile(values, 0.95)
+    if p50 is None:
+        return "-"
+    return f"{p50:.1f}s / {p95:.1f}s"
+
+class Dashboard:
+    def __init__(self, stats, refresh_per_second=4) -> None:
+        self.stats = stats
+        self.refresh_per_second = refresh_per_second
+        self.live = None
+
+    def render(self):
+        stats = self.stats
+        now = time.monotonic()
+        table = Table(title="Union Auto Bot", expand=True)
+        for column in ("Chain", "In Flight", "Pending Nonces", "Sent", "Confirmed", "Indexed", "Replaced", "Errors", "Error %", "tx/s", "Confirm p50/p95", "Index p50/p95"):
+            table.add_column(column, justify="right" if column != "Chain" else "left")
+        total_rate = 0.0
+        for name, chain in sorted(stats.chains.items()):
+            rate = chain.rate(now)
+            total_rate += rate
+            attempts = chain.sent + chain.errors
+            error_rate = f"{chain.errors / attempts * 100:.1f}" if attempts else "-"
+            table.add_row(
+                name, str(chain.in_flight), str(chain.pending), str(chain.sent), str(chain.confirmed),
+                str(chain.indexed), str(chain.replaced), str(chain.errors), error_rate, f"{rate:.2f}",
+                format_latency(chain.confirm_latency), format_latency(chain.index_latency),
+            )
+        summary = Text(
+            f"Elapsed {format_seconds(now - stats.started_at)}  |  "
+            f"Accounts {stats.accounts_done}/{stats.accounts_total}  |  "
+            f"Waiting For Delay {stats.waiting}  |  {total_rate:.2f} tx/s",
+            justify="center",
+        )
+        return Group(table, summary)
+
+    def __enter__(self):
+        self.live = Live(get_renderable=self.render, console=get_console(), refresh_per_second=self.refresh_per_second)
+        self.live.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        self.live.__exit__(*args)
+        self.live = None
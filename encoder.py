@@ -0,0 +1,84 @@
+AMOUNT = 0
+SENDER = 1
+RECEIVER = 2
+
+def word(value: int):
+    return value.to_bytes(32, "big")
+
+def padded(data: bytes):
+    return data + b"\x00" * (-len(data) % 32)
+
+def to_bytes(value: str):
+    if value.startswith("0x"):
+        return bytes.fromhex(value[2:])
+    return value.encode("utf-8")
+
+class OperandTemplate:
+    def __init__(self, parts: list) -> None:
+        self.parts = []
+        self.slots = []
+        joinable = False
+        for part in parts:
+            if isinstance(part, int):
+                self.slots.append((len(self.parts), part))
+                self.parts.append(b"")
+                joinable = False
+            elif joinable:
+                self.parts[-1] += part
+            else:
+                self.parts.append(part)
+                joinable = True
+
+    def render(self, amount: int, sender: bytes, receiver: bytes):
+        values = (word(amount), padded(sender), padded(receiver))
+        parts = self.parts.copy()
+        for index, slot in self.slots:
+            parts[index] = values[slot]
+        return b"".join(parts)
+
+class OperandEncoder:
+    def __init__(self, base_token: str) -> None:
+        self.base_token = to_bytes(base_token)
+        self.templates = {}
+
+    def order_parts(self, route, receiver_length: int, zero_amount: bool):
+        amount = word(0) if zero_amount else AMOUNT
+        constants = [self.base_token, route.symbol.encode("utf-8"), route.name.encode("utf-8"), to_bytes(route.quote_token)]
+        dynamic = [(20, SENDER, 32), (receiver_length, RECEIVER, len(padded(bytes(receiver_length))))]
+        dynamic += [(len(data), padded(data), len(padded(data))) for data in constants]
+        offsets = []
+        offset = 320
+        for _, _, size in dynamic:
+            offsets.append(offset)
+            offset += 32 + size
+        parts = [
+            word(offsets[0]), word(offsets[1]), word(offsets[2]), amount,
+            word(offsets[3]), word(offsets[4]), word(18), word(0), word(offsets[5]), amount,
+        ]
+        for length, data, _ in dynamic:
+            parts += [word(length), data]
+        return parts, offset
+
+    def compile(self, route, receiver_length: int):
+        instructions = []
+        for index in range(1 + route.zero_amount_orders):
+            order, order_size = self.order_parts(route, receiver_length, zero_amount=index > 0)
+            instructions.append(([word(1), word(3), word(96), word(order_size)] + order, 128 + order_size))
+        parts = [word(32), word(len(instructions))]
+        offset = 32 * len(instructions)
+        for _, size in instructions:
+            parts.append(word(offset))
+            offset += size
+        for instruction, _ in instructions:
+            parts += instruction
+        return OperandTemplate(parts)
+
+    def encode(self, route, amount: int, sender: str, receiver: str):
+        sender_bytes = to_bytes(sender)
+        receiver_bytes = to_bytes(receiver)
+        key = (route.pair, len(receiver_bytes))
+        template = self.templates.get(key)
+        if template is None:
+            template = self.compile(route, len(receiver_bytes))
+            self.templates[key] = template
+        return template.render(amount, sender_bytes, receiver_bytes)
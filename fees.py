@@ -0,0 +1,65 @@
+import asyncio
+import time
+from ui import logger_warn
+
+BASE_FEE_MAX_CHANGE = 1.125
+
+class FeeTracker:
+    def __init__(self, client, headroom_blocks=3, min_interval=0.5, max_interval=6.0, idle_timeout=60) -> None:
+        self.client = client
+        self.headroom_blocks = headroom_blocks
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.idle_timeout = idle_timeout
+        self.base_fee = None
+        self.block_number = None
+        self.last_used = 0.0
+        self.lock = asyncio.Lock()
+        self.task = None
+
+    @property
+    def poll_interval(self):
+        return min(self.max_interval, max(self.min_interval, self.client.block_time / 2))
+
+    async def refresh(self):
+        block = await self.client.web3.eth.get_block("latest")
+        if self.block_number is None or block["number"] > self.block_number:
+            self.client.observe_block(block["number"])
+            self.block_number = block["number"]
+            self.base_fee = block.get("baseFeePerGas", 0)
+
+    async def latest_block_number(self):
+        client = self.client
+        if client.block_checked_at is not None and time.monotonic() - client.block_checked_at < self.poll_interval:
+            return client.last_block
+        block_number = await client.web3.eth.get_block_number()
+        client.observe_block(block_number)
+        return max(block_number, client.last_block or 0)
+
+    async def get_base_fee(self):
+        self.last_used = time.monotonic()
+        if self.base_fee is None:
+            async with self.lock:
+                if self.base_fee is None:
+                    await self.refresh()
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return self.base_fee
+
+    def max_fee(self, base_fee: int, priority_fee: int):
+        return int(base_fee * BASE_FEE_MAX_CHANGE ** self.headroom_blocks) + priority_fee
+
+    async def run(self):
+        while time.monotonic() - self.last_used < self.idle_timeout:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                if self.block_number is None or await self.latest_block_number() > self.block_number:
+                    await self.refresh()
+            except Exception as e:
+                logger_warn(f"Fee Refresh Failed: {str(e)}")
+        self.base_fee = None
+
+    async def close(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+import time
+from ui import logger_error
+
+DONE_STATES = ("confirmed", "indexed")
+
+class RunJournal:
+    def __init__(self, path="journal.jsonl", flush_interval=0.2) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self.units = {}
+        self.buffer = []
+        self.file = None
+        self.flushed = None
+        self.task = None
+
+    def open(self):
+        valid_size = 0
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    if not line.endswith(b"\n"):
+                        break
+                    valid_size += len(line)
+                    self.units.setdefault(tuple(entry.pop("unit")), {}).update(entry)
+            os.truncate(self.path, valid_size)
+        self.file = open(self.path, "a", encoding="utf-8")
+        return self
+
+    def get(self, unit: tuple):
+        return self.units.get(unit)
+
+    def is_done(self, unit: tuple):
+        entry = self.units.get(unit)
+        return entry is not None and entry.get("state") in DONE_STATES
+
+    def pending_units(self):
+        return sum(1 for entry in self.units.values() if entry.get("state") not in DONE_STATES)
+
+    def record(self, unit: tuple, state: str, **fields):
+        entry = {"state": state, "time": int(time.time()), **fields}
+        self.units.setdefault(unit, {}).update(entry)
+        self.buffer.append(json.dumps({"unit": list(unit), **entry}) + "\n")
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    def write(self, lines: list):
+        self.file.writelines(lines)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    async def flush(self):
+        lines, self.buffer = self.buffer, []
+        flushed, self.flushed = self.flushed, None
+        try:
+            if lines:
+                await asyncio.to_thread(self.write, lines)
+        except Exception as e:
+            self.buffer[:0] = lines
+            if flushed and not flushed.done():
+                flushed.set_exception(e)
+            raise
+        if flushed and not flushed.done():
+            flushed.set_result(None)
+
+    async def commit(self):
+        if not self.buffer:
+            return
+        if self.flushed is None:
+            self.flushed = asyncio.get_running_loop().create_future()
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        await asyncio.shield(self.flushed)
+
+    async def run(self):
+        while self.buffer or self.flushed:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger_error(f"Journal Write Failed: {str(e)}")
+                return
+
+    async def close(self, finished=False):
+        if self.task:
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        if self.file:
+            try:
+                await self.flush()
+            except Exception as e:
+                logger_error(f"Journal Write Failed: {str(e)}")
+            self.file.close()
+            self.file = None
+        if finished and os.path.exists(self.path):
+            os.remove(self.path)
+            self.units.clear()
@@ -0,0 +1,38 @@
+import time
+
+class BalanceLedger:
+    def __init__(self, resync_interval=300, resync_every=20, batch_size=100) -> None:
+        self.resync_interval = resync_interval
+        self.resync_every = resync_every
+        self.batch_size = batch_size
+        self.balances = {}
+
+    def set_balance(self, chain_key: str, address: str, wei: int):
+        self.balances[(chain_key, address)] = {"wei": wei, "synced_at": time.monotonic(), "debits": 0}
+
+    def is_stale(self, entry: dict):
+        return entry["debits"] >= self.resync_every or time.monotonic() - entry["synced_at"] >= self.resync_interval
+
+    async def snapshot(self, client, chain_key: str, addresses: list):
+        for start in range(0, len(addresses), self.batch_size):
+            chunk = addresses[start:start + self.batch_size]
+            results = await client.batch_request([("eth_getBalance", [address, "latest"]) for address in chunk])
+            for address, result in zip(chunk, results):
+                if result is not None:
+                    self.set_balance(chain_key, address, int(result, 16))
+
+    async def get_balance(self, client, chain_key: str, address: str):
+        entry = self.balances.get((chain_key, address))
+        if entry is None or self.is_stale(entry):
+            self.set_balance(chain_key, address, await client.web3.eth.get_balance(address))
+            entry = self.balances[(chain_key, address)]
+        return entry["wei"]
+
+    def debit(self, chain_key: str, address: str, wei: int):
+        entry = self.balances.get((chain_key, address))
+        if entry is not None:
+            entry["wei"] = max(0, entry["wei"] - wei)
+            entry["debits"] += 1
+
+    def forget(self, chain_key: str, address: str):
+        self.balances.pop((chain_key, address), None)
@@ -1,46 +1,175 @@
+import argparse
 import asyncio
-from union import Union
-from ui import display_banner, logger_info, logger_success, logger_error
-from utils import load_accounts, generate_address, clear_terminal
+import json
+import os
+import sys
+import time
+import itertools
+from dotenv import load_dotenv
+from routes import RouteRegistry
+from ui import display_banner, flush_logs, log_sink, logger_info, logger_success, logger_error
+from utils import clear_terminal
 
-async def main():
+CONFIG_OPTIONS = ("route", "tx_count", "accounts_file", "concurrency", "max_pending", "min_delay", "max_delay", "no_banner", "dry_run", "burst", "no_wait_receipt")
+FLAG_OPTIONS = ("no_banner", "dry_run", "burst", "no_wait_receipt")
+
+def resolve_route(routes, value):
+    value = str(value).strip()
+    if value.lower() == "all":
+        return routes.all_option
+    if value.isdigit():
+        option = int(value)
+        if 1 <= option <= routes.all_option:
+            return option
+        raise ValueError(f"Route Option Must Be Between 1 And {routes.all_option}")
+    try:
+        return routes.get(value).option
+    except KeyError:
+        raise ValueError(f"Unknown Route '{value}'")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Union Auto Bot. Runs interactively unless --route is given.")
+    parser.add_argument("--config", help="JSON file with any of the options below, flags take precedence")
+    parser.add_argument("--route", help="route option number, route pair name or 'all'")
+    parser.add_argument("--tx-count", type=int, help="transfers per route and account")
+    parser.add_argument("--accounts-file", help="CSV or JSONL account file, defaults to ACCOUNTS_FILE or .env")
+    parser.add_argument("--concurrency", type=int, help="accounts processed at the same time per chain lane")
+    parser.add_argument("--max-pending", type=int, help="unconfirmed transfers allowed per account and chain")
+    parser.add_argument("--min-delay", type=int, help="minimum seconds between transfers")
+    parser.add_argument("--max-delay", type=int, help="maximum seconds between transfers")
+    parser.add_argument("--no-banner", action="store_true", default=None, help="skip the start-up banner")
+    parser.add_argument("--dry-run", action="store_true", default=None, help="simulate, estimate and sign every transfer without broadcasting")
+    parser.add_argument("--burst", action="store_true", default=None, help="pre-sign all transfers of a route and account, then broadcast them in one batch")
+    parser.add_argument("--no-wait-receipt", action="store_true", default=None, help="move on once a transfer is broadcast and confirm it in the background")
+    args = parser.parse_args(argv)
+    if args.config:
+        try:
+            with open(args.config, encoding="utf-8") as file:
+                config = json.load(file)
+        except (OSError, ValueError) as e:
+            parser.error(f"Cannot Read Config {args.config}: {str(e)}")
+        if not isinstance(config, dict):
+            parser.error(f"Config {args.config} Must Be A JSON Object")
+        config_argv = []
+        for key, value in config.items():
+            key = key.replace("-", "_")
+            if key not in CONFIG_OPTIONS:
+                parser.error(f"Unknown Config Option '{key}'")
+            if getattr(args, key) is not None:
+                continue
+            option = "--" + key.replace("_", "-")
+            if key in FLAG_OPTIONS:
+                if not isinstance(value, bool):
+                    parser.error(f"Config Option '{key}' Must Be true Or false")
+                if value:
+                    config_argv.append(option)
+            elif value is not None:
+                config_argv += [option, str(value)]
+        parser.parse_args(config_argv, namespace=args)
+    if args.route is not None:
+        try:
+            args.option = resolve_route(RouteRegistry.load(), args.route)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.tx_count is None:
+            parser.error("--tx-count is required with --route")
+    elif args.tx_count is not None:
+        parser.error("--route is required with --tx-count")
+    if args.tx_count is not None and args.tx_count < 1:
+        parser.error("--tx-count must be a positive number")
+    return args
+
+async def main(args):
+    headless = args.route is not None
+    show_banner = not headless and not args.no_banner
+    log_sink.configure(log_file=os.getenv("LOG_FILE", "logs.jsonl"), terminal=os.getenv("LOG_TERMINAL", "1") != "0")
+    from accounts import iter_accounts
+    from union import Union
+    bot = Union()
+    bot.dashboard = os.getenv("DASHBOARD", "0") == "1"
+    bot.dry_run = bool(args.dry_run)
+    bot.burst = bool(args.burst)
+    bot.wait_for_receipt = not args.no_wait_receipt
+    if os.getenv("RPC_HEDGE_AFTER"):
+        bot.rpc_pool.hedge_after = float(os.getenv("RPC_HEDGE_AFTER"))
+    if os.getenv("RPC_RATE_LIMIT"):
+        bot.rpc_pool.rate = float(os.getenv("RPC_RATE_LIMIT"))
+    if os.getenv("STUCK_TX_BLOCKS"):
+        bot.replacer.deadline_blocks = int(os.getenv("STUCK_TX_BLOCKS"))
+    if os.getenv("MAX_FEE_BUMPS"):
+        bot.replacer.max_replacements = int(os.getenv("MAX_FEE_BUMPS"))
+    if args.concurrency is not None:
+        bot.max_concurrency = args.concurrency
+    if args.max_pending is not None:
+        bot.max_pending_txs = args.max_pending
+    if args.min_delay is not None:
+        bot.min_delay = args.min_delay
+    if args.max_delay is not None:
+        bot.max_delay = args.max_delay
+    bot.max_delay = max(bot.max_delay, bot.min_delay)
+    metrics_server = None
     try:
-        bot = Union()
-        display_banner()
+        if show_banner:
+            display_banner()
         logger_info("Starting Union Auto Swap")
-        accounts = load_accounts()
-        if not accounts:
+        accounts = iter_accounts(args.accounts_file or os.getenv("ACCOUNTS_FILE"))
+        try:
+            first_account = next(accounts, None)
+        except OSError as e:
+            logger_error(f"Reading Accounts Failed: {str(e)}")
+            return 1
+        if first_account is None:
             logger_error("No Accounts Loaded")
-            return
-        option = bot.print_question()
-        clear_terminal()
-        display_banner()
-        logger_info(f"Account's Total: {len(accounts)}")
-        separator = "=" * 22
-        for idx, account in enumerate(accounts, start=1):
-            if account:
-                private_key = account["PrivateKey"]
-                xion_address = account["XionAddress"]
-                babylon_address = account["BabylonAddress"]
-                logger_info(f"{separator}[ {idx} Of {len(accounts)} ]{separator}")
-                if not private_key or not xion_address or not babylon_address:
-                    logger_error("Invalid Account Data")
-                    continue
-                address = generate_address(private_key)
-                if not address:
-                    logger_error("Invalid Private Key or Library Version Not Supported")
-                    continue
-                bot.xion_address[address] = xion_address
-                bot.babylon_address[address] = babylon_address
-                await bot.process_accounts(private_key, address, option)
+            return 1
+        accounts = itertools.chain([first_account], accounts)
+        if headless:
+            option = args.option
+            bot.tx_count = args.tx_count
+        else:
+            option = bot.print_question()
+            flush_logs()
+            if show_banner:
+                clear_terminal()
+                display_banner()
+        logger_info(f"Max Concurrent Accounts Per Chain: {bot.max_concurrency}")
+        if os.getenv("METRICS_PORT"):
+            from metrics import MetricsServer
+            metrics_server = MetricsServer(bot.metrics, port=int(os.getenv("METRICS_PORT")))
+            await metrics_server.start()
+        if bot.dashboard:
+            from dashboard import Dashboard
+            flush_logs()
+            log_sink.configure(terminal=False)
+            with Dashboard(bot.stats):
+                await bot.process_accounts_concurrently(accounts, option)
+            log_sink.configure(terminal=os.getenv("LOG_TERMINAL", "1") != "0")
+        else:
+            await bot.process_accounts_concurrently(accounts, option)
         logger_info("=" * 65)
+        chains = bot.stats.chains.values()
+        errors = sum(chain.errors + chain.skipped for chain in chains)
+        sent = sum(chain.sent for chain in chains)
+        confirmed = sum(chain.confirmed for chain in chains)
+        if errors or (sent and not confirmed):
+            logger_error(f"All Accounts Have Been Processed With {errors} Failed Or Skipped Transfers")
+            return 1
         logger_success("All Accounts Have Been Processed")
+        return 0
     except Exception as e:
         logger_error(f"Error: {e}")
         raise e
+    finally:
+        bot.metrics.print_summary()
+        if bot.dry_run:
+            bot.simulation.print_summary(bot.metrics, bot.routes, time.monotonic() - bot.stats.started_at)
+        if metrics_server:
+            await metrics_server.close()
+        await bot.close()
 
 if __name__ == "__main__":
+    load_dotenv()
+    args = parse_args()
     try:
-        asyncio.run(main())
+        sys.exit(asyncio.run(main(args)))
     except KeyboardInterrupt:
         logger_error("EXIT Union Testnet - BOT")
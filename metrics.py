@@ -0,0 +1,152 @@
+import bisect
+import time
+from ui import flush_logs, get_console, logger_error, logger_info
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+def format_labels(names: tuple, values: tuple, extra=""):
+    pairs = [f'{name}="{str(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, fraction: float):
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else float("inf")
+        return float("inf")
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.sum += other.sum
+        self.count += other.count
+
+class StageTimer:
+    def __init__(self, metrics, stage: str, chain: str, route: str) -> None:
+        self.metrics = metrics
+        self.labels = (stage, chain, route)
+        self.started_at = None
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(*self.labels, time.perf_counter() - self.started_at, error=exc_type is not None)
+        return False
+
+class Metrics:
+    STAGE_LABELS = ("stage", "chain", "route")
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.latency = {}
+        self.errors = {}
+
+    def time(self, stage: str, chain: str, route: str):
+        return StageTimer(self, stage, chain, route)
+
+    def observe(self, stage: str, chain: str, route: str, seconds: float, error=False):
+        labels = (stage, chain, route)
+        histogram = self.latency.get(labels)
+        if histogram is None:
+            histogram = self.latency[labels] = Histogram()
+        histogram.observe(seconds)
+        if error:
+            self.errors[labels] = self.errors.get(labels, 0) + 1
+
+    def render(self):
+        lines = [
+            "# HELP union_stage_seconds Latency of each transfer stage.",
+            "# TYPE union_stage_seconds histogram",
+        ]
+        for labels, histogram in sorted(self.latency.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                cumulative += count
+                bucket_labels = format_labels(self.STAGE_LABELS, labels, 'le="%s"' % bound)
+                lines.append(f"union_stage_seconds_bucket{bucket_labels} {cumulative}")
+            lines.append(f"union_stage_seconds_sum{format_labels(self.STAGE_LABELS, labels)} {histogram.sum:.6f}")
+            lines.append(f"union_stage_seconds_count{format_labels(self.STAGE_LABELS, labels)} {histogram.count}")
+        lines.append("# HELP union_stage_errors_total Stage attempts that raised an error.")
+        lines.append("# TYPE union_stage_errors_total counter")
+        for labels, count in sorted(self.errors.items()):
+            lines.append(f"union_stage_errors_total{format_labels(self.STAGE_LABELS, labels)} {count}")
+        lines.append("# HELP union_run_started_seconds Unix time the run started.")
+        lines.append("# TYPE union_run_started_seconds gauge")
+        lines.append(f"union_run_started_seconds {self.started_at:.3f}")
+        return "\n".join(lines) + "\n"
+
+    def print_summary(self):
+        if not self.latency:
+            return
+        flush_logs()
+        get_console().print(self.summary(), justify="center")
+
+    def summary(self):
+        from rich.table import Table
+        stages = {}
+        for (stage, chain, route), histogram in self.latency.items():
+            key = (chain, stage)
+            merged = stages.get(key)
+            if merged is None:
+                merged = stages[key] = [Histogram(), 0]
+            merged[0].merge(histogram)
+            merged[1] += self.errors.get((stage, chain, route), 0)
+        table = Table(title="Stage Latency Summary")
+        for column in ("Chain", "Stage", "Count", "Errors", "Mean", "p50 <=", "p95 <=", "Total"):
+            table.add_column(column, justify="left" if column in ("Chain", "Stage") else "right")
+        for (chain, stage), (histogram, errors) in sorted(stages.items()):
+            table.add_row(
+                chain, stage, str(histogram.count), str(errors),
+                f"{histogram.sum / histogram.count:.3f}s",
+                f"{histogram.quantile(0.5)}s", f"{histogram.quantile(0.95)}s",
+                f"{histogram.sum:.1f}s",
+            )
+        return table
+
+class MetricsServer:
+    def __init__(self, metrics, host="127.0.0.1", port=9464) -> None:
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.runner = None
+
+    async def handle(self, request):
+        from aiohttp import web
+        return web.Response(text=self.metrics.render(), content_type="text/plain", charset="utf-8")
+
+    async def start(self):
+        from aiohttp import web
+        try:
+            app = web.Application()
+            app.router.add_get("/metrics", self.handle)
+            self.runner = web.AppRunner(app, access_log=None)
+            await self.runner.setup()
+            await web.TCPSite(self.runner, self.host, self.port).start()
+            logger_info(f"Metrics: http://{self.host}:{self.port}/metrics")
+        except Exception as e:
+            logger_error(f"Metrics Server Failed: {str(e)}")
+            await self.close()
+
+    async def close(self):
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
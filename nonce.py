@@ -0,0 +1,47 @@
+import asyncio
+
+NONCE_ERRORS = ("nonce too low", "nonce too high", "already known", "replacement transaction underpriced", "invalid nonce")
+
+KNOWN_TX_ERRORS = ("already known", "known transaction")
+
+def is_nonce_error(error: Exception):
+    message = str(error).lower()
+    return any(text in message for text in NONCE_ERRORS)
+
+def is_known_error(error):
+    message = str(error).lower()
+    return any(text in message for text in KNOWN_TX_ERRORS)
+
+class NonceManager:
+    def __init__(self) -> None:
+        self.nonces = {}
+        self.locks = {}
+
+    async def get_key(self, client, address: str):
+        chain_id = await client.get_chain_id()
+        return (chain_id, address)
+
+    async def allocate(self, client, address: str):
+        nonces = await self.allocate_many(client, address, 1)
+        return nonces[0]
+
+    async def allocate_many(self, client, address: str, count: int):
+        key = await self.get_key(client, address)
+        async with self.locks.setdefault(key, asyncio.Lock()):
+            nonce = self.nonces.get(key)
+            if nonce is None:
+                nonce = await client.web3.eth.get_transaction_count(address, "pending")
+            self.nonces[key] = nonce + count
+            return list(range(nonce, nonce + count))
+
+    async def resync(self, client, address: str):
+        key = await self.get_key(client, address)
+        async with self.locks.setdefault(key, asyncio.Lock()):
+            nonce = await client.web3.eth.get_transaction_count(address, "pending")
+            self.nonces[key] = nonce
+            return nonce
+
+    async def reset(self, client, address: str):
+        key = await self.get_key(client, address)
+        async with self.locks.setdefault(key, asyncio.Lock()):
+            self.nonces.pop(key, None)
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from aiohttp import ClientSession, ClientTimeout
+from ratelimit import RateLimited, RateLimiter, parse_retry_after
+from ui import logger_warn
+
+HEADERS = {
+    "Accept": "application/graphql-response+json, application/json",
+    "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Origin": "https://app.union.build",
+    "Referer": "https://app.union.build/",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-site",
+    "Content-Type": "application/json"
+}
+
+def build_query(tx_hashes: list):
+    variables = ", ".join(f"$h{index}: String!" for index in range(len(tx_hashes)))
+    fields = " ".join(
+        f"t{index}: v2_transfers(args: {{p_transaction_hash: $h{index}}}) {{ packet_hash }}"
+        for index in range(len(tx_hashes))
+    )
+    return {
+        "query": f"query GetPacketHashesBySubmissionTxHash({variables}) {{ {fields} }}",
+        "variables": {f"h{index}": tx_hash for index, tx_hash in enumerate(tx_hashes)},
+        "operationName": "GetPacketHashesBySubmissionTxHash"
+    }
+
+class PacketLookup:
+    def __init__(self, future, now: float, initial_delay: float, timeout: float) -> None:
+        self.future = future
+        self.next_attempt = now + initial_delay
+        self.deadline = now + timeout
+        self.delay = initial_delay
+
+class PacketResolver:
+    def __init__(self, api_url: str, batch_size=50, batch_window=1.0, initial_delay=5.0, max_delay=30.0, timeout=150.0, rate=5.0) -> None:
+        self.api_url = api_url
+        self.limiter = RateLimiter(rate=rate, max_rate=50.0)
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.session = None
+        self.pending = {}
+        self.resolved = {}
+        self.wakeup = None
+        self.task = None
+
+    async def resolve(self, tx_hash: str):
+        if tx_hash in self.resolved:
+            return self.resolved[tx_hash]
+        lookup = self.pending.get(tx_hash)
+        if lookup is None:
+            lookup = PacketLookup(asyncio.get_running_loop().create_future(), time.monotonic(), self.initial_delay, self.timeout)
+            self.pending[tx_hash] = lookup
+            if self.wakeup is None:
+                self.wakeup = asyncio.Event()
+            self.wakeup.set()
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return await asyncio.shield(lookup.future)
+
+    def finish(self, tx_hash: str, packet):
+        lookup = self.pending.pop(tx_hash, None)
+        if packet:
+            self.resolved[tx_hash] = packet
+        if lookup and not lookup.future.done():
+            lookup.future.set_result(packet)
+
+    def retry_later(self, tx_hash: str, now: float):
+        lookup = self.pending[tx_hash]
+        if now >= lookup.deadline:
+            self.finish(tx_hash, None)
+            return
+        lookup.delay = min(self.max_delay, lookup.delay * 1.5)
+        lookup.next_attempt = now + lookup.delay
+
+    async def fetch(self, tx_hashes: list):
+        if self.session is None or self.session.closed:
+            self.session = ClientSession(timeout=ClientTimeout(total=120))
+        await self.limiter.acquire()
+        async with self.session.post(url=self.api_url, headers=HEADERS, json=build_query(tx_hashes)) as response:
+            if response.status == 429:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                self.limiter.on_limited(retry_after)
+                raise RateLimited("GraphQL API Returned HTTP 429", retry_after)
+            response.raise_for_status()
+            result = await response.json(content_type=None)
+        self.limiter.on_success()
+        if result.get("errors"):
+            messages = "; ".join(str(error.get("message", error)) if isinstance(error, dict) else str(error) for error in result["errors"])
+            raise Exception(f"GraphQL API Returned Errors: {messages}")
+        data = result.get("data") or {}
+        return [data.get(f"t{index}") or [] for index in range(len(tx_hashes))]
+
+    async def run(self):
+        while self.pending:
+            now = time.monotonic()
+            due = [tx_hash for tx_hash, lookup in self.pending.items() if lookup.next_attempt <= now + self.batch_window]
+            for start in range(0, len(due), self.batch_size):
+                chunk = due[start:start + self.batch_size]
+                try:
+                    packets = await self.fetch(chunk)
+                except RateLimited:
+                    for tx_hash in chunk:
+                        if tx_hash in self.pending:
+                            self.pending[tx_hash].next_attempt = self.limiter.blocked_until
+                    continue
+                except Exception as e:
+                    logger_warn(f"Packet Hash Query Failed: {str(e)}")
+                    packets = [[] for _ in chunk]
+                now = time.monotonic()
+                for tx_hash, packet in zip(chunk, packets):
+                    if tx_hash not in self.pending:
+                        continue
+                    if packet:
+                        self.finish(tx_hash, packet)
+                    else:
+                        self.retry_later(tx_hash, now)
+            if not self.pending:
+                break
+            sleep_for = max(0.0, min(lookup.next_attempt for lookup in self.pending.values()) - time.monotonic())
+            self.wakeup.clear()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout=sleep_for)
+            except asyncio.TimeoutError:
+                pass
+
+    async def close(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        for lookup in self.pending.values():
+            if not lookup.future.done():
+                lookup.future.cancel()
+        self.pending.clear()
+        if self.session and not self.session.closed:
+            await self.session.close()
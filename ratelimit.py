@@ -0,0 +1,95 @@
+import asyncio
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+RATE_LIMIT_CODES = (-32005, -32029, 429)
+
+class RateLimited(Exception):
+    def __init__(self, message: str, retry_after=None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def rate_limit_error(reply):
+    replies = reply if isinstance(reply, list) else [reply]
+    for item in replies:
+        error = item.get("error") if isinstance(item, dict) else None
+        if not error:
+            continue
+        message = str(error.get("message", "")).lower()
+        if error.get("code") in RATE_LIMIT_CODES or "rate limit" in message or "too many requests" in message:
+            data = error.get("data")
+            retry_after = None
+            if isinstance(data, dict):
+                retry_after = parse_retry_after(data.get("retry_after") or (data.get("rate") or {}).get("backoff_seconds"))
+            return RateLimited(error.get("message", "Rate Limited"), retry_after)
+    return None
+
+class RateLimiter:
+    def __init__(self, rate=20.0, burst=None, min_rate=0.5, max_rate=200.0, increase=1.0, decrease=0.7) -> None:
+        self.rate = rate
+        self.max_burst = burst or max(1.0, rate)
+        self.burst = self.max_burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.tokens = self.burst
+        self.refilled_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.granted = deque()
+        self.limited = 0
+        self.lock = asyncio.Lock()
+
+    @property
+    def blocked(self):
+        return time.monotonic() < self.blocked_until
+
+    def refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+
+    def observed_rate(self, now: float, window=1.0):
+        while self.granted and now - self.granted[0] > window:
+            self.granted.popleft()
+        return len(self.granted) / window
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self.refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.granted.append(now)
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def on_success(self):
+        self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+        self.burst = min(self.max_burst, max(1.0, self.rate))
+
+    def on_limited(self, retry_after=None):
+        now = time.monotonic()
+        observed = self.observed_rate(now)
+        self.rate = max(self.min_rate, min(self.rate, observed or self.rate) * self.decrease)
+        self.burst = min(self.max_burst, max(1.0, self.rate))
+        self.refill(now)
+        self.tokens = 0.0
+        self.blocked_until = max(self.blocked_until, now + (retry_after if retry_after is not None else 1 / self.rate))
+        self.limited += 1
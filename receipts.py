@@ -0,0 +1,96 @@
+import asyncio
+from ui import logger_warn
+
+def format_receipt(receipt: dict):
+    formatted = dict(receipt)
+    for field in ("blockNumber", "status", "gasUsed", "effectiveGasPrice", "cumulativeGasUsed", "transactionIndex"):
+        value = receipt.get(field)
+        if isinstance(value, str):
+            formatted[field] = int(value, 16)
+    return formatted
+
+class ReceiptWatcher:
+    def __init__(self, client, batch_size=100, min_interval=0.5, max_interval=6.0) -> None:
+        self.client = client
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.pending = {}
+        self.polled_block = None
+        self.task = None
+
+    @property
+    def poll_interval(self):
+        return min(self.max_interval, max(self.min_interval, self.client.block_time / 2))
+
+    async def wait(self, tx_hash: str, timeout=600):
+        future = self.pending.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.pending[tx_hash] = future
+        if self.task is None or self.task.done():
+            self.polled_block = None
+            self.task = asyncio.create_task(self.run())
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            if self.pending.get(tx_hash) is future:
+                self.pending.pop(tx_hash)
+            raise TimeoutError(f"Transaction {tx_hash} Not Mined After {timeout} Seconds")
+
+    async def wait_any(self, hashes: list, timeout=600):
+        waiters = {asyncio.create_task(self.wait(tx_hash, timeout=timeout)): tx_hash for tx_hash in hashes}
+        landed_hash = None
+        pending = set(waiters)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for waiter in done:
+                    if not waiter.exception():
+                        landed_hash = waiters[waiter]
+                        return landed_hash, waiter.result()
+            raise next(iter(waiters)).exception()
+        finally:
+            for waiter, tx_hash in waiters.items():
+                waiter.cancel()
+                if tx_hash != landed_hash:
+                    self.forget(tx_hash)
+
+    def forget(self, tx_hash: str):
+        future = self.pending.pop(tx_hash, None)
+        if future is not None and not future.done():
+            future.cancel()
+
+    async def run(self):
+        while self.pending:
+            try:
+                block_number = await self.client.web3.eth.get_block_number()
+                self.client.observe_block(block_number)
+                if block_number != self.polled_block:
+                    await self.poll_receipts()
+                    self.polled_block = block_number
+            except Exception as e:
+                logger_warn(f"Receipt Polling Failed: {str(e)}")
+            if self.pending:
+                await asyncio.sleep(self.poll_interval)
+
+    async def poll_receipts(self):
+        hashes = list(self.pending)
+        for start in range(0, len(hashes), self.batch_size):
+            chunk = hashes[start:start + self.batch_size]
+            results = await self.client.batch_request([("eth_getTransactionReceipt", [tx_hash]) for tx_hash in chunk])
+            for tx_hash, result in zip(chunk, results):
+                if not result:
+                    continue
+                future = self.pending.pop(tx_hash, None)
+                if future is not None and not future.done():
+                    future.set_result(format_receipt(result))
+
+    async def close(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        for future in self.pending.values():
+            if not future.done():
+                future.cancel()
+        self.pending.clear()
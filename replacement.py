@@ -0,0 +1,67 @@
+import asyncio
+import math
+from nonce import is_known_error
+from ui import logger_warn
+
+class TxReplacer:
+    def __init__(self, signer, deadline_blocks=3, bump=1.125, max_replacements=3, timeout=600) -> None:
+        self.signer = signer
+        self.deadline_blocks = deadline_blocks
+        self.bump = bump
+        self.max_replacements = max_replacements
+        self.timeout = timeout
+
+    def bump_fees(self, client, transaction: dict, base_fee: int):
+        priority_fee = max(math.ceil(transaction["maxPriorityFeePerGas"] * self.bump), transaction["maxPriorityFeePerGas"] + 1)
+        max_fee = max(math.ceil(transaction["maxFeePerGas"] * self.bump), client.fee_tracker.max_fee(base_fee, priority_fee))
+        return {**transaction, "maxPriorityFeePerGas": priority_fee, "maxFeePerGas": max_fee}
+
+    async def wait(self, client, transaction: dict, private_key: bytes, tx_hash: str, on_replace=None, on_replaced=None):
+        hashes = [tx_hash]
+        waiters = {}
+        landed_hash = None
+        replacements = 0
+        deadline = None if client.last_block is None else client.last_block + self.deadline_blocks
+        try:
+            while True:
+                for pending_hash in hashes:
+                    if pending_hash not in waiters:
+                        waiters[pending_hash] = asyncio.create_task(client.wait_for_receipt(pending_hash, timeout=self.timeout))
+                done, _ = await asyncio.wait(waiters.values(), timeout=client.receipt_watcher.poll_interval, return_when=asyncio.FIRST_COMPLETED)
+                for pending_hash, waiter in waiters.items():
+                    if waiter in done and not waiter.exception():
+                        landed_hash = pending_hash
+                        return landed_hash, waiter.result()
+                if done:
+                    raise next(iter(done)).exception()
+                if client.last_block is None:
+                    continue
+                if deadline is None:
+                    deadline = client.last_block + self.deadline_blocks
+                if client.last_block < deadline:
+                    continue
+                if replacements >= self.max_replacements:
+                    raise TimeoutError(f"Tx {hashes[-1]} Not Mined {self.deadline_blocks} Blocks After {replacements} Replacements")
+                replacements += 1
+                deadline = client.last_block + self.deadline_blocks
+                transaction = self.bump_fees(client, transaction, await client.fee_tracker.get_base_fee())
+                raw_tx, signed_hash = await self.signer.sign(transaction, private_key)
+                new_hash = client.web3.to_hex(signed_hash)
+                if on_replace:
+                    await on_replace(hashes + [new_hash])
+                try:
+                    await client.web3.eth.send_raw_transaction(raw_tx)
+                except Exception as e:
+                    if not is_known_error(e):
+                        logger_warn(f"Replacing {hashes[-1]} Failed: {str(e)}")
+                        if "nonce too low" in str(e).lower():
+                            replacements = self.max_replacements
+                        continue
+                hashes.append(new_hash)
+                if on_replaced:
+                    on_replaced(hashes)
+        finally:
+            for pending_hash, waiter in waiters.items():
+                waiter.cancel()
+                if pending_hash != landed_hash:
+                    client.receipt_watcher.forget(pending_hash)
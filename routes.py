@@ -0,0 +1,70 @@
+import json
+import os
+from pathlib import Path
+
+ROUTES_FILE = Path(__file__).resolve().parent / "routes.json"
+
+class Chain:
+    def __init__(self, key: str, data: dict) -> None:
+        self.key = key
+        self.name = data["name"]
+        self.rpc_urls = data["rpc_urls"]
+        override = os.getenv(f"{key.upper()}_RPC_URLS")
+        if override:
+            self.rpc_urls = [url.strip() for url in override.split(",") if url.strip()]
+        self.ticker = data["ticker"]
+        self.amount = data["amount"]
+        self.explorer = data["explorer"]
+
+    def explorer_url(self, tx_hash: str):
+        return self.explorer.format(tx_hash=tx_hash)
+
+class Route:
+    def __init__(self, option: int, chain: Chain, data: dict) -> None:
+        self.option = option
+        self.chain = chain
+        self.pair = data["pair"]
+        self.channel_id = data["channel_id"]
+        self.priority_fee = data["priority_fee"]
+        self.receiver = data["receiver"]
+        self.symbol = data["symbol"]
+        self.name = data["name"]
+        self.quote_token = data["quote_token"]
+        self.zero_amount_orders = data.get("zero_amount_orders", 0)
+        if self.receiver not in ("evm", "xion", "babylon"):
+            raise ValueError(f"Unknown Receiver '{self.receiver}' For {self.pair}")
+
+class RouteRegistry:
+    def __init__(self, chains: dict, routes: list) -> None:
+        self.chains = chains
+        self.routes = routes
+        self.by_option = {route.option: route for route in routes}
+        self.by_pair = {route.pair: route for route in routes}
+
+    @classmethod
+    def load(cls, path=ROUTES_FILE):
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        chains = {key: Chain(key, chain) for key, chain in data["chains"].items()}
+        routes = []
+        for option, route in enumerate(data["routes"], start=1):
+            if route["chain"] not in chains:
+                raise ValueError(f"Unknown Chain '{route['chain']}' For {route['pair']}")
+            routes.append(Route(option, chains[route["chain"]], route))
+        return cls(chains, routes)
+
+    @property
+    def all_option(self):
+        return len(self.routes) + 1
+
+    def __iter__(self):
+        return iter(self.routes)
+
+    def __len__(self):
+        return len(self.routes)
+
+    def get(self, pair: str):
+        return self.by_pair[pair]
+
+    def get_option(self, option: int):
+        return self.by_option[option]
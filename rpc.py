@@ -0,0 +1,292 @@
+import asyncio
+import time
+from web3 import AsyncWeb3
+from web3.providers.async_base import AsyncBaseProvider
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from fees import FeeTracker
+from ratelimit import RateLimited, RateLimiter, parse_retry_after, rate_limit_error
+from receipts import ReceiptWatcher
+from ui import logger_warn
+
+HEDGED_METHODS = (
+    "eth_blockNumber",
+    "eth_chainId",
+    "eth_getBalance",
+    "eth_getBlockByNumber",
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+)
+
+UNSAFE_METHODS = ("eth_sendRawTransaction",)
+
+class EndpointError(Exception):
+    pass
+
+class Endpoint:
+    def __init__(self, url: str, alpha=0.2, cooldown=5.0, max_cooldown=120.0, rate=20.0) -> None:
+        self.url = url
+        self.limiter = RateLimiter(rate=rate)
+        self.alpha = alpha
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.latency = None
+        self.error_rate = 0.0
+        self.failures = 0
+        self.down_until = 0.0
+
+    @property
+    def available(self):
+        return time.monotonic() >= self.down_until and not self.limiter.blocked
+
+    @property
+    def score(self):
+        latency = self.latency if self.latency is not None else 0.5
+        return latency * (1 + 10 * self.error_rate) + 5 * self.error_rate
+
+    def observe_latency(self, seconds: float):
+        self.latency = seconds if self.latency is None else (1 - self.alpha) * self.latency + self.alpha * seconds
+
+    def record_success(self, seconds: float):
+        self.observe_latency(seconds)
+        self.error_rate *= 1 - self.alpha
+        self.failures = 0
+        self.down_until = 0.0
+
+    def record_failure(self):
+        self.error_rate = (1 - self.alpha) * self.error_rate + self.alpha
+        self.failures += 1
+        if self.failures >= 3:
+            self.down_until = time.monotonic() + min(self.max_cooldown, self.cooldown * 2 ** (self.failures - 3))
+
+class EndpointProvider(AsyncBaseProvider):
+    def __init__(self, client) -> None:
+        super().__init__()
+        self.client = client
+
+    async def make_request(self, method, params):
+        self.client.request_id += 1
+        if method == "eth_chainId" and self.client.chain_id is not None:
+            return {"jsonrpc": "2.0", "id": self.client.request_id, "result": hex(self.client.chain_id)}
+        payload = {"jsonrpc": "2.0", "id": self.client.request_id, "method": method, "params": params}
+        reply = await self.client.send(payload, hedge=method in HEDGED_METHODS)
+        if method == "eth_chainId" and isinstance(reply, dict) and reply.get("result"):
+            self.client.chain_id = int(reply["result"], 16)
+        return reply
+
+    async def is_connected(self, show_traceback=False):
+        return self.client.healthy
+
+class ChainClient:
+    def __init__(self, rpc_urls: list, timeout=60, pool_size=100, hedge_after=None, rate=20.0, max_rate_limited_rounds=5) -> None:
+        self.endpoints = [Endpoint(url, rate=rate) for url in rpc_urls]
+        self.max_rate_limited_rounds = max_rate_limited_rounds
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.hedge_after = hedge_after
+        self.session = None
+        self.web3 = None
+        self.chain_id = None
+        self.contracts = {}
+        self.healthy = False
+        self.last_block = None
+        self.last_block_at = None
+        self.block_checked_at = None
+        self.block_time = 3.0
+        self.last_checked = 0.0
+        self.request_id = 0
+        self.receipt_watcher = ReceiptWatcher(self)
+        self.fee_tracker = FeeTracker(self)
+
+    async def connect(self):
+        self.session = ClientSession(
+            connector=TCPConnector(limit=self.pool_size, keepalive_timeout=60),
+            timeout=ClientTimeout(total=self.timeout)
+        )
+        self.web3 = AsyncWeb3(EndpointProvider(self))
+        await self.check_health()
+        self.chain_id = await self.web3.eth.chain_id
+
+    def ranked(self):
+        return sorted(self.endpoints, key=lambda endpoint: (not endpoint.available, endpoint.score))
+
+    async def post(self, endpoint, payload, partial=False):
+        await endpoint.limiter.acquire()
+        started_at = time.monotonic()
+        try:
+            async with self.session.post(endpoint.url, json=payload) as response:
+                if response.status == 429:
+                    raise RateLimited(f"{endpoint.url} Returned HTTP 429", parse_retry_after(response.headers.get("Retry-After")))
+                if response.status >= 500:
+                    raise EndpointError(f"{endpoint.url} Returned HTTP {response.status}")
+                response.raise_for_status()
+                reply = await response.json(content_type=None)
+            limited = rate_limit_error(reply)
+            if limited and partial and isinstance(reply, list):
+                endpoint.limiter.on_limited(limited.retry_after)
+                endpoint.record_success(time.monotonic() - started_at)
+                return reply
+            if limited:
+                raise limited
+        except asyncio.CancelledError:
+            endpoint.observe_latency(time.monotonic() - started_at)
+            raise
+        except RateLimited as e:
+            endpoint.limiter.on_limited(e.retry_after)
+            raise
+        except Exception:
+            endpoint.record_failure()
+            raise
+        endpoint.limiter.on_success()
+        endpoint.record_success(time.monotonic() - started_at)
+        return reply
+
+    async def send(self, payload, hedge=False, partial=False):
+        for _ in range(self.max_rate_limited_rounds):
+            errors = []
+            reply = await self.send_once(payload, hedge, errors, partial)
+            if reply is not None:
+                return reply
+            if not all(isinstance(error, RateLimited) for error in errors):
+                break
+        raise errors[-1]
+
+    async def send_once(self, payload, hedge: bool, errors: list, partial=False):
+        remaining = self.ranked()
+        limit = 2 if hedge and self.hedge_after is not None else 1
+        pending = set()
+        try:
+            while remaining or pending:
+                if remaining and len(pending) < limit:
+                    pending.add(asyncio.create_task(self.post(remaining.pop(0), payload, partial)))
+                hedging = remaining and len(pending) < limit
+                done, pending = await asyncio.wait(pending, timeout=self.hedge_after if hedging else None, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    errors.append(task.exception())
+        finally:
+            for task in pending:
+                task.cancel()
+        return None
+
+    async def check_health(self):
+        try:
+            self.observe_block(await self.web3.eth.get_block_number())
+            self.healthy = True
+        except Exception:
+            self.healthy = False
+            raise
+        finally:
+            self.last_checked = time.monotonic()
+
+    async def probe_endpoints(self):
+        payload = {"jsonrpc": "2.0", "id": 0, "method": "eth_blockNumber", "params": []}
+        results = await asyncio.gather(*(self.post(endpoint, payload) for endpoint in self.endpoints), return_exceptions=True)
+        for endpoint, result in zip(self.endpoints, results):
+            if isinstance(result, Exception):
+                logger_warn(f"RPC Endpoint {endpoint.url} Failed Health Check: {str(result)}")
+        self.healthy = any(not isinstance(result, Exception) for result in results)
+        self.last_checked = time.monotonic()
+
+    def observe_block(self, block_number: int):
+        now = time.monotonic()
+        self.block_checked_at = now
+        if self.last_block is not None and block_number <= self.last_block:
+            return False
+        if self.last_block is not None:
+            observed = (now - self.last_block_at) / (block_number - self.last_block)
+            self.block_time = 0.8 * self.block_time + 0.2 * observed
+        self.last_block = block_number
+        self.last_block_at = now
+        return True
+
+    async def get_chain_id(self):
+        if self.chain_id is None:
+            self.chain_id = await self.web3.eth.chain_id
+        return self.chain_id
+
+    def get_contract(self, address: str, abi: list):
+        contract = self.contracts.get(address)
+        if contract is None:
+            contract = self.web3.eth.contract(address=self.web3.to_checksum_address(address), abi=abi)
+            self.contracts[address] = contract
+        return contract
+
+    async def batch_request(self, calls: list, errors=None):
+        payload = []
+        for method, params in calls:
+            self.request_id += 1
+            payload.append({"jsonrpc": "2.0", "id": self.request_id, "method": method, "params": params})
+        hedge = all(method in HEDGED_METHODS for method, _ in calls)
+        partial = any(method in UNSAFE_METHODS for method, _ in calls)
+        results = {}
+        pending = payload
+        for _ in range(self.max_rate_limited_rounds if partial else 1):
+            replies = await self.send(pending, hedge=hedge, partial=partial)
+            if isinstance(replies, dict):
+                raise Exception(replies.get("error", {}).get("message", "Batch Request Rejected"))
+            results.update((reply.get("id"), reply) for reply in replies)
+            pending = [request for request in pending if rate_limit_error(results.get(request["id"]))]
+            if not pending:
+                break
+        if errors is not None:
+            errors.extend((results.get(request["id"]) or {}).get("error") for request in payload)
+        return [(results.get(request["id"]) or {}).get("result") for request in payload]
+
+    async def wait_for_receipt(self, tx_hash: str, timeout=600):
+        return await self.receipt_watcher.wait(tx_hash, timeout=timeout)
+
+    async def close(self):
+        await self.receipt_watcher.close()
+        await self.fee_tracker.close()
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+class RpcPool:
+    def __init__(self, timeout=60, health_check_interval=30, hedge_after=None, rate=20.0) -> None:
+        self.timeout = timeout
+        self.rate = rate
+        self.health_check_interval = health_check_interval
+        self.hedge_after = hedge_after
+        self.clients = {}
+        self.locks = {}
+        self.health_task = None
+
+    async def get_client(self, chain):
+        client = self.clients.get(chain.key)
+        if client is not None:
+            if not client.healthy:
+                await client.check_health()
+            return client
+        lock = self.locks.setdefault(chain.key, asyncio.Lock())
+        async with lock:
+            client = self.clients.get(chain.key)
+            if client is None:
+                client = ChainClient(chain.rpc_urls, timeout=self.timeout, hedge_after=self.hedge_after, rate=self.rate)
+                try:
+                    await client.connect()
+                except Exception:
+                    await client.close()
+                    raise
+                self.clients[chain.key] = client
+        if self.health_task is None:
+            self.health_task = asyncio.create_task(self.run_health_checks())
+        return client
+
+    async def run_health_checks(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            for key, client in list(self.clients.items()):
+                if time.monotonic() - client.last_checked < self.health_check_interval:
+                    continue
+                await client.probe_endpoints()
+                if not client.healthy:
+                    logger_warn(f"All RPC Endpoints For {key} Are Failing")
+
+    async def close(self):
+        if self.health_task:
+            self.health_task.cancel()
+            self.health_task = None
+        for client in self.clients.values():
+            await client.close()
+        self.clients.clear()
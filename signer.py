@@ -0,0 +1,122 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+import rlp
+from eth_utils import keccak
+
+try:
+    from coincurve import PrivateKey as CoincurvePrivateKey
+except ImportError:
+    CoincurvePrivateKey = None
+
+BACKEND = "coincurve" if CoincurvePrivateKey else "eth_account"
+
+def as_int(value):
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+def as_bytes(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value or b"")
+
+def is_fast_path(transaction: dict):
+    return (
+        CoincurvePrivateKey is not None
+        and "maxFeePerGas" in transaction
+        and as_int(transaction.get("type", 2)) == 2
+        and not transaction.get("accessList")
+        and transaction.get("to")
+    )
+
+def sign_dynamic_fee(transaction: dict, private_key: bytes):
+    fields = [
+        as_int(transaction["chainId"]),
+        as_int(transaction["nonce"]),
+        as_int(transaction["maxPriorityFeePerGas"]),
+        as_int(transaction["maxFeePerGas"]),
+        as_int(transaction["gas"]),
+        as_bytes(transaction["to"]),
+        as_int(transaction.get("value", 0)),
+        as_bytes(transaction.get("data", b"")),
+        [],
+    ]
+    signature = CoincurvePrivateKey(private_key).sign_recoverable(keccak(b"\x02" + rlp.encode(fields)), hasher=None)
+    raw_transaction = b"\x02" + rlp.encode(fields + [signature[64], int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:64], "big")])
+    return raw_transaction, keccak(raw_transaction)
+
+def sign_transaction(transaction: dict, private_key: bytes):
+    if is_fast_path(transaction):
+        return sign_dynamic_fee(transaction, private_key)
+    from eth_account import Account
+    signed = Account.sign_transaction(transaction, private_key)
+    raw_transaction = getattr(signed, "raw_transaction", None) or signed.rawTransaction
+    return bytes(raw_transaction), bytes(signed.hash)
+
+def sign_batch(items: list):
+    results = []
+    for transaction, private_key in items:
+        try:
+            results.append(sign_transaction(transaction, private_key))
+        except Exception as e:
+            results.append(e)
+    return results
+
+class Signer:
+    def __init__(self, workers=None, batch_size=64, batch_window=0.002) -> None:
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.pool = None
+        self.batch = []
+        self.flush_handle = None
+
+    async def sign(self, transaction: dict, private_key: bytes):
+        if self.workers <= 1:
+            return sign_transaction(transaction, private_key)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.batch.append((transaction, private_key, future))
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.batch_window, self.flush)
+        return await future
+
+    def flush(self):
+        if self.flush_handle:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        batch, self.batch = self.batch, []
+        if not batch:
+            return
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        done = asyncio.get_running_loop().run_in_executor(self.pool, sign_batch, [(transaction, private_key) for transaction, private_key, _ in batch])
+        done.add_done_callback(lambda result: self.finish(batch, result))
+
+    def finish(self, batch: list, done):
+        error = None if done.cancelled() else done.exception()
+        results = None if done.cancelled() or error else done.result()
+        for index, (_, _, future) in enumerate(batch):
+            if future.done():
+                continue
+            if done.cancelled():
+                future.cancel()
+            elif error:
+                future.set_exception(error)
+            elif isinstance(results[index], Exception):
+                future.set_exception(results[index])
+            else:
+                future.set_result(results[index])
+
+    def close(self):
+        if self.flush_handle:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        for _, _, future in self.batch:
+            if not future.done():
+                future.cancel()
+        self.batch = []
+        if self.pool:
+            self.pool.shutdown(wait=False)
+            self.pool = None
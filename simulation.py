@@ -0,0 +1,55 @@
+from collections import Counter
+from ui import flush_logs, get_console
+
+REPORT_STAGES = {"encode": "Encode", "simulate": "Simulate", "estimate_gas": "Estimate", "sign": "Sign"}
+
+class RouteSimulation:
+    def __init__(self) -> None:
+        self.ok = 0
+        self.reverted = 0
+        self.errors = 0
+        self.reasons = Counter()
+
+class SimulationReport:
+    def __init__(self) -> None:
+        self.routes = {}
+
+    def route(self, route):
+        result = self.routes.get(route.pair)
+        if result is None:
+            result = self.routes[route.pair] = RouteSimulation()
+        return result
+
+    def record_ok(self, route):
+        self.route(route).ok += 1
+
+    def record_revert(self, route, reason: str):
+        result = self.route(route)
+        result.reverted += 1
+        result.reasons[reason] += 1
+
+    def record_error(self, route, error: str):
+        result = self.route(route)
+        result.errors += 1
+        result.reasons[error] += 1
+
+    def print_summary(self, metrics, routes, elapsed: float):
+        from rich.table import Table
+        flush_logs()
+        table = Table(title=f"Dry Run Summary ({elapsed:.1f}s)")
+        for column in ("Route", "OK", "Reverted", "Errors", *REPORT_STAGES.values(), "Top Failure"):
+            table.add_column(column, justify="left" if column in ("Route", "Top Failure") else "right")
+        for route in routes:
+            result = self.routes.get(route.pair)
+            if result is None:
+                continue
+            timings = []
+            for stage in REPORT_STAGES:
+                histogram = metrics.latency.get((stage, route.chain.key, route.pair))
+                timings.append(f"{histogram.sum / histogram.count * 1000:.1f}ms" if histogram else "-")
+            top = result.reasons.most_common(1)
+            table.add_row(
+                route.pair, str(result.ok), str(result.reverted),
+                str(result.errors), *timings, f"{top[0][0][:60]} (x{top[0][1]})" if top else "-",
+            )
+        get_console().print(table, justify="center")
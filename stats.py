@@ -0,0 +1,86 @@
+import time
+from collections import deque
+
+def percentile(values, fraction: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class ChainStats:
+    def __init__(self, window=1000) -> None:
+        self.in_flight = 0
+        self.pending = 0
+        self.sent = 0
+        self.confirmed = 0
+        self.indexed = 0
+        self.errors = 0
+        self.replaced = 0
+        self.skipped = 0
+        self.confirm_latency = deque(maxlen=window)
+        self.index_latency = deque(maxlen=window)
+        self.confirmed_at = deque(maxlen=window)
+
+    def rate(self, now: float, period=60.0):
+        while self.confirmed_at and now - self.confirmed_at[0] > period:
+            self.confirmed_at.popleft()
+        return len(self.confirmed_at) / period
+
+class RunStats:
+    def __init__(self) -> None:
+        self.started_at = time.monotonic()
+        self.chains = {}
+        self.broadcast_at = {}
+        self.confirmed_at = {}
+        self.accounts_total = 0
+        self.accounts_done = 0
+        self.waiting = 0
+
+    def chain(self, name: str):
+        stats = self.chains.get(name)
+        if stats is None:
+            stats = self.chains[name] = ChainStats()
+        return stats
+
+    def send_started(self, chain: str):
+        self.chain(chain).in_flight += 1
+
+    def send_finished(self, chain: str):
+        self.chain(chain).in_flight -= 1
+
+    def broadcast(self, chain: str, tx_hash: str):
+        stats = self.chain(chain)
+        stats.sent += 1
+        stats.pending += 1
+        self.broadcast_at[tx_hash] = time.monotonic()
+
+    def skipped(self, chain: str):
+        self.chain(chain).skipped += 1
+
+    def replaced(self, chain: str):
+        self.chain(chain).replaced += 1
+
+    def confirmed(self, chain: str, tx_hash: str, sent_hash=None):
+        stats = self.chain(chain)
+        now = time.monotonic()
+        broadcast_at = self.broadcast_at.pop(sent_hash or tx_hash, None)
+        if broadcast_at is None:
+            return
+        stats.pending -= 1
+        stats.confirmed += 1
+        stats.confirmed_at.append(now)
+        stats.confirm_latency.append(now - broadcast_at)
+        self.confirmed_at[tx_hash] = now
+
+    def failed(self, chain: str, tx_hash=None):
+        stats = self.chain(chain)
+        stats.errors += 1
+        if tx_hash and self.broadcast_at.pop(tx_hash, None) is not None:
+            stats.pending -= 1
+
+    def indexed(self, chain: str, tx_hash: str):
+        stats = self.chain(chain)
+        confirmed_at = self.confirmed_at.pop(tx_hash, None)
+        stats.indexed += 1
+        if confirmed_at is not None:
+            stats.index_latency.append(time.monotonic() - confirmed_at)
@@ -0,0 +1,33 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from encoder import OperandEncoder
+from routes import RouteRegistry
+
+GOLDEN = json.loads((Path(__file__).resolve().parent / "operands.json").read_text(encoding="utf-8"))
+ROUTES = {route.pair: route for route in RouteRegistry.load()}
+
+def receiver_for(route, case: dict):
+    if route.receiver == "xion":
+        return case["xion_address"]
+    if route.receiver == "babylon":
+        return case["babylon_address"]
+    return case["sender"]
+
+def test_golden_covers_every_route():
+    assert {case["pair"] for case in GOLDEN["cases"]} == set(ROUTES)
+    assert {route.receiver for route in ROUTES.values()} == {"evm", "xion", "babylon"}
+
+@pytest.mark.parametrize("case", GOLDEN["cases"], ids=lambda case: f"{case['pair']}-{case['sender'][-4:]}-{case['amount']}")
+def test_encode_matches_golden_operand(case):
+    route = ROUTES[case["pair"]]
+    encoder = OperandEncoder(GOLDEN["base_token"])
+    operand = encoder.encode(route, int(case["amount"]), case["sender"], receiver_for(route, case))
+    assert "0x" + operand.hex() == case["operand"]
+    assert encoder.encode(route, int(case["amount"]), case["sender"], receiver_for(route, case)) == operand
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import time
+from ui import logger_error, logger_info, logger_success
+
+class PacketTracker:
+    def __init__(self, resolver, rpc_pool, journal, stats, metrics, results_file="packets.jsonl", queue_size=1000, workers=64) -> None:
+        self.resolver = resolver
+        self.rpc_pool = rpc_pool
+        self.journal = journal
+        self.stats = stats
+        self.metrics = metrics
+        self.results_file = results_file
+        self.queue_size = queue_size
+        self.workers = workers
+        self.queue = None
+        self.tasks = []
+        self.pending = 0
+
+    def start(self):
+        if self.queue is None:
+            self.queue = asyncio.Queue(maxsize=self.queue_size)
+            self.tasks = [asyncio.create_task(self.run()) for _ in range(self.workers)]
+
+    async def submit(self, route, address: str, tx_hash: str, block_number=None, unit=None, landing=None):
+        self.start()
+        self.pending += 1
+        await self.queue.put((route, address, tx_hash, block_number, unit, landing))
+
+    def save(self, record: dict):
+        with open(self.results_file, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+    async def track(self, route, address: str, tx_hash: str, block_number, unit, landing=None):
+        record = {"time": int(time.time()), "pair": route.pair, "address": address, "tx_hash": tx_hash, "block_number": block_number, "packet_hash": None}
+        labels = (route.chain.key, route.pair)
+        if block_number is None:
+            sent_hash = tx_hash
+            try:
+                with self.metrics.time("receipt", *labels):
+                    if landing is None:
+                        client = await self.rpc_pool.get_client(route.chain)
+                        receipt = await client.wait_for_receipt(tx_hash, timeout=600)
+                    else:
+                        tx_hash, receipt = await landing
+            except Exception:
+                self.stats.failed(route.chain.name, sent_hash)
+                raise
+            record["tx_hash"] = tx_hash
+            record["block_number"] = receipt["blockNumber"]
+            self.stats.confirmed(route.chain.name, tx_hash, sent_hash=sent_hash)
+            if unit:
+                self.journal.record(unit, "confirmed", tx_hash=tx_hash, block_number=record["block_number"])
+        with self.metrics.time("indexing", *labels):
+            packet = await self.resolver.resolve(tx_hash)
+        if packet:
+            record["packet_hash"] = packet[0]["packet_hash"]
+            self.stats.indexed(route.chain.name, tx_hash)
+            if unit:
+                self.journal.record(unit, "indexed", packet_hash=record["packet_hash"])
+            logger_success(f"Submit Success: {tx_hash}")
+            logger_info(f"Explorer: https://app.union.build/explorer/transfers/{record['packet_hash']}")
+        else:
+            logger_error(f"Submit Failed: {tx_hash}")
+        await asyncio.to_thread(self.save, record)
+
+    async def run(self):
+        while True:
+            route, address, tx_hash, block_number, unit, landing = await self.queue.get()
+            try:
+                await self.track(route, address, tx_hash, block_number, unit, landing)
+            except Exception as e:
+                logger_error(f"Packet Tracking Failed For {tx_hash}: {str(e)}")
+            finally:
+                self.pending -= 1
+                self.queue.task_done()
+
+    async def join(self):
+        if self.pending:
+            logger_info("Waiting For Pending Packet Hashes...")
+            await self.queue.join()
+
+    async def close(self):
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+        self.queue = None
@@ -1,10 +1,109 @@
+import atexit
+import json
+import queue
+import threading
 import time
-from rich.console import Console
 
-# Initialize rich console
-console = Console()
+console = None
+console_lock = threading.Lock()
+
+def get_console():
+    global console
+    if console is None:
+        with console_lock:
+            if console is None:
+                from rich.console import Console
+                console = Console()
+    return console
+
+LOG_FORMATS = {
+    "info": "[bold magenta]{msg}[/bold magenta]",
+    "warn": "[bold yellow]⚠️ {msg}[/bold yellow]",
+    "error": "[bold red]❌ {msg}[/bold red]",
+    "success": "[bold green]✅ {msg}[/bold green]",
+    "loading": "[bold cyan]⏳ {msg}[/bold cyan]",
+    "step": "[bold white]👉 {msg}[/bold white]",
+}
+
+class LogSink:
+    def __init__(self, log_file="logs.jsonl", terminal=True, max_lines_per_second=20) -> None:
+        self.log_file = log_file
+        self.terminal = terminal
+        self.max_lines_per_second = max_lines_per_second
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def configure(self, log_file=None, terminal=None, max_lines_per_second=None):
+        if log_file is not None:
+            self.log_file = log_file
+        if terminal is not None:
+            self.terminal = terminal
+        if max_lines_per_second is not None:
+            self.max_lines_per_second = max_lines_per_second
+
+    def emit(self, level: str, msg):
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self.run, name="log-sink", daemon=True)
+                    self.thread.start()
+        self.queue.put((time.time(), level, str(msg)))
+
+    def flush(self):
+        if self.thread is not None:
+            done = threading.Event()
+            self.queue.put(done)
+            done.wait(timeout=5)
+
+    def run(self):
+        file = open(self.log_file, "a", encoding="utf-8") if self.log_file else None
+        tokens = float(self.max_lines_per_second)
+        refilled_at = time.monotonic()
+        suppressed = 0
+        while True:
+            item = self.queue.get()
+            batch = [item]
+            while len(batch) < 500:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    if suppressed:
+                        get_console().print(f"[dim]... {suppressed} log lines suppressed, see {self.log_file}[/dim]", justify="center")
+                        suppressed = 0
+                    if file:
+                        file.flush()
+                    tokens = float(self.max_lines_per_second)
+                    item.set()
+                    continue
+                timestamp, level, msg = item
+                if file:
+                    file.write(json.dumps({"time": round(timestamp, 3), "level": level, "msg": msg}, ensure_ascii=False) + "\n")
+                if not self.terminal:
+                    continue
+                now = time.monotonic()
+                tokens = min(float(self.max_lines_per_second), tokens + (now - refilled_at) * self.max_lines_per_second)
+                refilled_at = now
+                if tokens < 1 and level != "error":
+                    suppressed += 1
+                    continue
+                tokens = max(0.0, tokens - 1)
+                if suppressed:
+                    get_console().print(f"[dim]... {suppressed} log lines suppressed, see {self.log_file}[/dim]", justify="center")
+                    suppressed = 0
+                get_console().print(LOG_FORMATS[level].format(msg=msg), justify="center")
+            if file:
+                file.flush()
+
+log_sink = LogSink()
+atexit.register(log_sink.flush)
 
 def display_banner():
+    log_sink.flush()
+    console = get_console()
     banner_text = """
 ██╗   ██╗    ███╗   ██╗    ██╗     ██████╗     ███╗   ██╗
 ██║   ██║    ████╗  ██║    ██║    ██╔═══██╗    ████╗  ██║
@@ -23,20 +122,23 @@ def display_banner():
     console.print(f"[green]+ Union AUTO BIY - CREATED BY KAZUHA[/green]", justify="center")
     console.print("-" * 50, style="green", justify="center")
 
+def flush_logs():
+    log_sink.flush()
+
 def logger_info(msg):
-    console.print(f"[bold magenta]{msg}[/bold magenta]", justify="center")
+    log_sink.emit("info", msg)
 
 def logger_warn(msg):
-    console.print(f"[bold yellow]⚠️ {msg}[/bold yellow]", justify="center")
+    log_sink.emit("warn", msg)
 
 def logger_error(msg):
-    console.print(f"[bold red]❌ {msg}[/bold red]", justify="center")
+    log_sink.emit("error", msg)
 
 def logger_success(msg):
-    console.print(f"[bold green]✅ {msg}[/bold green]", justify="center")
+    log_sink.emit("success", msg)
 
 def logger_loading(msg):
-    console.print(f"[bold cyan]⏳ {msg}[/bold cyan]", justify="center")
+    log_sink.emit("loading", msg)
 
 def logger_step(msg):
-    console.print(f"[bold white]👉 {msg}[/bold white]", justify="center")
+    log_sink.emit("step", msg)
@@ -1,21 +1,30 @@
 import asyncio
+import itertools
 import json
 import time
 import random
-from web3 import Web3
 from eth_utils import keccak
 from eth_abi.abi import encode
-from aiohttp import ClientSession, ClientTimeout
-from ui import logger_error, logger_success, logger_info, logger_loading, logger_step, logger_warn
-from utils import pad_hex, encode_hex_as_string, encode_string_as_bytes
+from web3.exceptions import ContractLogicError
+from accounts import AccountFeed
+from encoder import OperandEncoder
+from packets import PacketResolver
+from journal import RunJournal
+from ledger import BalanceLedger
+from metrics import Metrics
+from nonce import NonceManager, is_known_error, is_nonce_error
+from replacement import TxReplacer
+from routes import RouteRegistry
+from signer import Signer
+from simulation import SimulationReport
+from rpc import RpcPool
+from stats import RunStats
+from tracking import PacketTracker
+from ui import flush_logs, logger_error, logger_success, logger_info, logger_loading, logger_step, logger_warn
 
 class Union:
     def __init__(self) -> None:
         self.GRAPHQL_API = "https://graphql.union.build/v1/graphql"
-        self.SEPOLIA_RPC_URL = "https://sepolia.drpc.org/"
-        self.HOLESKY_RPC_URL = "https://ethereum-holesky-rpc.publicnode.com/"
-        self.SEI_RPC_URL = "https://evm-rpc-testnet.sei-apis.com/"
-        self.CORN_RPC_URL = "https://21000001.rpc.thirdweb.com/"
         self.UCS03_ROUTER_ADDRESS = "0x5FbE74A283f7954f10AA04C2eDf55578811aeb03"
         self.BASE_TOKEN_ADDRESS = "0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee"
         self.ERC20_CONTRACT_ABI = json.loads('''[
@@ -45,593 +54,344 @@ class Union:
                 "type": "function",
             },
         ]
-        self.xion_address = {}
-        self.babylon_address = {}
-        self.used_rpc = 0
+        self.routes = RouteRegistry.load()
         self.tx_count = 0
-        self.sepolia_amount = 0.0001
-        self.holesky_amount = 0.0001
-        self.sei_amount = 0.01
-        self.corn_amount = 0.0000001
+        self.max_concurrency = 5
+        self.rpc_pool = RpcPool(timeout=60, health_check_interval=30)
+        self.nonce_manager = NonceManager()
+        self.signer = Signer()
+        self.replacer = TxReplacer(self.signer, deadline_blocks=3, max_replacements=3)
+        self.balance_ledger = BalanceLedger(resync_interval=300, resync_every=20)
+        self.journal = RunJournal("journal.jsonl")
+        self.stats = RunStats()
+        self.metrics = Metrics()
+        self.dashboard = False
+        self.operand_encoder = OperandEncoder(self.BASE_TOKEN_ADDRESS)
+        self.packet_resolver = PacketResolver(self.GRAPHQL_API)
+        self.packet_tracker = PacketTracker(self.packet_resolver, self.rpc_pool, self.journal, self.stats, self.metrics)
+        self.wait_for_receipt = True
+        self.dry_run = False
+        self.burst = False
+        self.salt_counter = itertools.count()
+        self.simulation = SimulationReport()
+        self.run_finished = False
+        self.max_pending_txs = 1
+        self.send_slots = {}
+        self.pending_sends = {}
+        self.lanes = {}
+        self.landings = {}
         self.min_delay = 1
         self.max_delay = 1
 
-    async def get_web3_with_check(self, address: str, retries=3, timeout=60):
-        request_kwargs = {"timeout": timeout}
+    async def get_web3_with_check(self, chain, retries=3):
         for attempt in range(retries):
             try:
-                web3 = Web3(Web3.HTTPProvider(self.used_rpc, request_kwargs=request_kwargs))
-                web3.eth.get_block_number()
-                return web3
+                return await self.rpc_pool.get_client(chain)
             except Exception as e:
                 if attempt < retries - 1:
                     await asyncio.sleep(3)
                     continue
                 raise Exception(f"Failed to Connect to RPC: {str(e)}")
 
-    async def get_token_balance(self, address: str):
+    async def get_token_balance(self, chain, address: str):
         try:
-            web3 = await self.get_web3_with_check(address)
-            balance = web3.eth.get_balance(address)
+            client = await self.get_web3_with_check(chain)
+            balance = await self.balance_ledger.get_balance(client, chain.key, address)
             token_balance = balance / (10 ** 18)
             return token_balance
         except Exception as e:
             logger_error(f"Failed to get balance: {str(e)}")
             return None
 
-    def generate_instruction_data(self, address: str, amount: int, pair: str):
+    def generate_instruction_data(self, account, amount: int, route):
         try:
-            if pair == "Sepolia Testnet to Holesky Testnet":
-                quote_token = "0x92b3bc0bc3ac0ee60b04a0bbc4a09deb3914c886"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(704) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(448) +
-                    pad_hex(amount) +
-                    pad_hex(512) +
-                    pad_hex(576) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(640) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("ETH", 32) +
-                    pad_hex(5) +
-                    encode_string_as_bytes("Ether", 32) +
-                    pad_hex(20) +
-                    encode_hex_as_string(quote_token)
-                )
-
-            elif pair == "Sepolia Testnet to Babylon Testnet":
-                quote_token = "0x62626e313837656178666171656d67336e7466656e356a6b73656c77706b367636357a353438393266327070746c78356733703971736d73633967683463"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(768) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(480) +
-                    pad_hex(amount) +
-                    pad_hex(544) +
-                    pad_hex(608) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(672) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(42) +
-                    encode_string_as_bytes(self.babylon_address[address], 64) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("ETH", 32) +
-                    pad_hex(5) +
-                    encode_string_as_bytes("Ether", 32) +
-                    pad_hex(62) +
-                    encode_hex_as_string(quote_token, 64)
-                )
-
-            elif pair == "Holesky Testnet to Sepolia Testnet":
-                quote_token = "0xf6e7e2725b40ec8226036906cab0f5dc3722b8e7"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(704) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(448) +
-                    pad_hex(amount) +
-                    pad_hex(512) +
-                    pad_hex(576) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(640) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("ETH", 32) +
-                    pad_hex(5) +
-                    encode_string_as_bytes("Ether", 32) +
-                    pad_hex(20) +
-                    encode_hex_as_string(quote_token)
-                )
-
-            elif pair == "Holesky Testnet to Xion Testnet":
-                quote_token = "0x78696f6e317863397661687972726d33676d6c39787338396b3866753933673366736d35326a686a636b6d6778727a6c617a66307376303571366e75756e65"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(768) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(480) +
-                    pad_hex(amount) +
-                    pad_hex(544) +
-                    pad_hex(608) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(672) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(43) +
-                    encode_string_as_bytes(self.xion_address[address], 64) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("ETH", 32) +
-                    pad_hex(5) +
-                    encode_string_as_bytes("Ether", 32) +
-                    pad_hex(63) +
-                    encode_hex_as_string(quote_token, 64)
-                )
-
-            elif pair == "Holesky Testnet to Babylon Testnet":
-                quote_token = "0x62626e31766a6172726e72716d366e63346a36303964746537677771666363706461643963776474747973356432737a6a717770377274736c726e373636"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(768) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(480) +
-                    pad_hex(amount) +
-                    pad_hex(544) +
-                    pad_hex(608) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(672) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(42) +
-                    encode_string_as_bytes(self.babylon_address[address], 64) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("ETH", 32) +
-                    pad_hex(5) +
-                    encode_string_as_bytes("Ether", 32) +
-                    pad_hex(62) +
-                    encode_hex_as_string(quote_token, 64)
-                )
-
-            elif pair == "Sei Testnet to Xion Testnet":
-                quote_token = "0x78696f6e31746d733932636d33346c786c6e346b76787732786473676e63756d7a6570723565326575673930766d74797735357a38646a757176776e656537"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(768) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(480) +
-                    pad_hex(amount) +
-                    pad_hex(544) +
-                    pad_hex(608) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(672) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(43) +
-                    encode_string_as_bytes(self.xion_address[address], 64) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("SEI", 32) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("Sei", 32) +
-                    pad_hex(63) +
-                    encode_hex_as_string(quote_token, 64)
-                )
-
-            elif pair == "Sei Testnet to Bitcorn Testnet":
-                quote_token = "0xe86bed5b0813430df660d17363b89fe9bd8232d8"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(704) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(448) +
-                    pad_hex(amount) +
-                    pad_hex(512) +
-                    pad_hex(576) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(640) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("SEI", 32) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("Sei", 32) +
-                    pad_hex(20) +
-                    encode_hex_as_string(quote_token)
-                )
-
-            elif pair == "Sei Testnet to Binance Smart Chain Testnet":
-                quote_token = "0xe86bed5b0813430df660d17363b89fe9bd8232d8"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(2) +
-                    pad_hex(64) +
-                    pad_hex(896) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(704) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(448) +
-                    pad_hex(amount) +
-                    pad_hex(512) +
-                    pad_hex(576) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(640) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("SEI", 32) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("Sei", 32) +
-                    pad_hex(20) +
-                    encode_hex_as_string(quote_token) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(704) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(448) +
-                    pad_hex(0) +
-                    pad_hex(512) +
-                    pad_hex(576) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(640) +
-                    pad_hex(0) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("SEI", 32) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("Sei", 32) +
-                    pad_hex(20) +
-                    encode_hex_as_string(quote_token)
-                )
-
-            elif pair == "Sei Testnet to Babylon Testnet":
-                quote_token = "0x62626e313639686e61396c7a7474797067343765686175303468353465786d756c30723079396a37706c6178737767356e33646537666e716438776e7579"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(2) +
-                    pad_hex(64) +
-                    pad_hex(960) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(768) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(480) +
-                    pad_hex(amount) +
-                    pad_hex(544) +
-                    pad_hex(608) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(672) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(42) +
-                    encode_string_as_bytes(self.babylon_address[address], 64) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("SEI", 32) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("Sei", 32) +
-                    pad_hex(62) +
-                    encode_hex_as_string(quote_token, 64) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(768) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(480) +
-                    pad_hex(0) +
-                    pad_hex(544) +
-                    pad_hex(608) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(672) +
-                    pad_hex(0) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(42) +
-                    encode_string_as_bytes(self.babylon_address[address], 64) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("SEI", 32) +
-                    pad_hex(3) +
-                    encode_string_as_bytes("Sei", 32) +
-                    pad_hex(62) +
-                    encode_hex_as_string(quote_token, 64)
-                )
-
-            elif pair == "Bitcorn Testnet to Xion Testnet":
-                quote_token = "0x78696f6e31683734366464796b396339796834666363757a6b636d65703839776d6b356e357a6b773735373237336d71636d75656d633338733278746d7466"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(768) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(480) +
-                    pad_hex(amount) +
-                    pad_hex(544) +
-                    pad_hex(608) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(672) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(43) +
-                    encode_string_as_bytes(self.xion_address[address], 64) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(4) +
-                    encode_string_as_bytes("BTCN", 32) +
-                    pad_hex(7) +
-                    encode_string_as_bytes("Bitcorn", 32) +
-                    pad_hex(63) +
-                    encode_hex_as_string(quote_token, 64)
-                )
-
-            elif pair == "Bitcorn Testnet to Sei Testnet":
-                quote_token = "0x92b3bc0bc3ac0ee60b04a0bbc4a09deb3914c886"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(704) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(448) +
-                    pad_hex(amount) +
-                    pad_hex(512) +
-                    pad_hex(576) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(640) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(4) +
-                    encode_string_as_bytes("BTCN", 32) +
-                    pad_hex(7) +
-                    encode_string_as_bytes("Bitcorn", 32) +
-                    pad_hex(20) +
-                    encode_hex_as_string(quote_token)
-                )
-
-            elif pair == "Bitcorn Testnet to Babylon Testnet":
-                quote_token = "0x62626e3170397a68377032667866337471766b306d64716e613273706b6a6c3030713230616a77656a34386d7a6d38327a6e61356e74377339707732706c"
-                operand = (
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(32) +
-                    pad_hex(1) +
-                    pad_hex(3) +
-                    pad_hex(96) +
-                    pad_hex(768) +
-                    pad_hex(320) +
-                    pad_hex(384) +
-                    pad_hex(480) +
-                    pad_hex(amount) +
-                    pad_hex(544) +
-                    pad_hex(608) +
-                    pad_hex(18) +
-                    pad_hex(0) +
-                    pad_hex(672) +
-                    pad_hex(amount) +
-                    pad_hex(20) +
-                    encode_hex_as_string(address) +
-                    pad_hex(42) +
-                    encode_string_as_bytes(self.babylon_address[address], 64) +
-                    pad_hex(20) +
-                    encode_hex_as_string(self.BASE_TOKEN_ADDRESS) +
-                    pad_hex(4) +
-                    encode_string_as_bytes("BTCN", 32) +
-                    pad_hex(7) +
-                    encode_string_as_bytes("Bitcorn", 32) +
-                    pad_hex(62) +
-                    encode_hex_as_string(quote_token, 64)
-                )
-
+            if route.receiver == "xion":
+                receiver = account.xion_address
+            elif route.receiver == "babylon":
+                receiver = account.babylon_address
+            else:
+                receiver = account.address
             instruction = {
                 "version": 0,
                 "opcode": 2,
-                "operand": "0x" + operand
+                "operand": self.operand_encoder.encode(route, amount, account.address, receiver)
             }
             return instruction
         except Exception as e:
             raise Exception(f"Generate Instruction Data Failed: {str(e)}")
 
-    async def perform_send(self, private_key: str, address: str, tx_amount: float, pair: str):
+    def build_send_call(self, client, route, address: str, instruction: bytes):
+        timeout_height = 0
+        timeout_timestamp = int(time.time() * 1_000_000_000) + 86_400_000_000_000
+        encoded_data = keccak(encode(["address", "uint256", "uint256"], [address, int(time.time()), next(self.salt_counter)]))
+        salt = "0x" + encoded_data.hex()
+        token_contract = client.get_contract(self.UCS03_ROUTER_ADDRESS, self.UCS03_CONTRACT_ABI)
+        return token_contract.functions.send(route.channel_id, timeout_height, timeout_timestamp, salt, instruction)
+
+    async def prepare_send(self, client, route, address: str, amount: int, send_call):
+        labels = (route.chain.key, route.pair)
+        timer = self.metrics.time
+        web3 = client.web3
+        if self.dry_run:
+            with timer("simulate", *labels):
+                await send_call.call({"from": address, "value": amount})
+        with timer("estimate_gas", *labels):
+            estimated_gas = await send_call.estimate_gas({"from": address, "value": amount})
+        with timer("base_fee", *labels):
+            base_fee = await client.fee_tracker.get_base_fee()
+        max_priority_fee = web3.to_wei(route.priority_fee, "gwei")
+        max_fee = client.fee_tracker.max_fee(base_fee, max_priority_fee)
+        return {
+            "from": address,
+            "value": amount,
+            "gas": int(estimated_gas * 1.2),
+            "maxFeePerGas": int(max_fee),
+            "maxPriorityFeePerGas": int(max_priority_fee),
+            "chainId": await client.get_chain_id(),
+        }
+
+    async def build_and_sign(self, route, account, send_calls: list, params: dict, nonces: list):
+        labels = (route.chain.key, route.pair)
+        timer = self.metrics.time
+        with timer("build", *labels):
+            transactions = await asyncio.gather(*(call.build_transaction({**params, "nonce": nonce}) for call, nonce in zip(send_calls, nonces)))
+        with timer("sign", *labels):
+            signed = await asyncio.gather(*(self.signer.sign(transaction, account.private_key) for transaction in transactions))
+        return list(transactions), signed
+
+    def record_simulated(self, route, address: str, amount: int, transactions: list):
+        for transaction in transactions:
+            self.simulation.record_ok(route)
+            self.balance_ledger.debit(route.chain.key, address, amount + transaction["gas"] * transaction["maxFeePerGas"])
+
+    def record_send_error(self, route, e: Exception):
+        if not self.dry_run:
+            return
+        if isinstance(e, ContractLogicError):
+            self.simulation.record_revert(route, getattr(e, "message", None) or str(e))
+        else:
+            self.simulation.record_error(route, str(e))
+
+    async def release_nonces(self, client, address: str, e: Exception):
+        if is_nonce_error(e):
+            await self.nonce_manager.resync(client, address)
+        else:
+            await self.nonce_manager.reset(client, address)
+
+    async def perform_send(self, route, account, tx_amount: float, wait_receipt=True, unit=None):
+        address = account.address
+        journaled = False
+        tx_hash = None
+        labels = (route.chain.key, route.pair)
+        timer = self.metrics.time
+        self.stats.send_started(route.chain.name)
         try:
-            web3 = await self.get_web3_with_check(address)
-            if pair == "Sepolia Testnet to Holesky Testnet":
-                channel_id = 8
-                fee = 1.5
-            elif pair == "Sepolia Testnet to Babylon Testnet":
-                channel_id = 7
-                fee = 1.5
-            elif pair == "Holesky Testnet to Sepolia Testnet":
-                channel_id = 2
-                fee = 0.001
-            elif pair == "Holesky Testnet to Xion Testnet":
-                channel_id = 4
-                fee = 0.001
-            elif pair == "Holesky Testnet to Babylon Testnet":
-                channel_id = 3
-                fee = 0.001
-            elif pair == "Sei Testnet to Xion Testnet":
-                channel_id = 1
-                fee = 1.1
-            elif pair == "Sei Testnet to Bitcorn Testnet":
-                channel_id = 2
-                fee = 1.1
-            elif pair == "Sei Testnet to Binance Smart Chain Testnet":
-                channel_id = 5
-                fee = 1.1
-            elif pair == "Sei Testnet to Babylon Testnet":
-                channel_id = 4
-                fee = 1.1
-            elif pair == "Bitcorn Testnet to Xion Testnet":
-                channel_id = 2
-                fee = 0.01
-            elif pair == "Bitcorn Testnet to Sei Testnet":
-                channel_id = 3
-                fee = 0.01
-            elif pair == "Bitcorn Testnet to Babylon Testnet":
-                channel_id = 1
-                fee = 0.01
+            with timer("connect", *labels):
+                client = await self.get_web3_with_check(route.chain)
+            web3 = client.web3
             amount = web3.to_wei(tx_amount, "ether")
-            timeout_height = 0
-            timeout_timestamp = int(time.time() * 1_000_000_000) + 86_400_000_000_000
-            timestamp_now = int(time.time())
-            encoded_data = keccak(encode(["address", "uint256"], [address, timestamp_now]))
-            salt = "0x" + encoded_data.hex()
-            instruction = self.generate_instruction_data(address, amount, pair)
-            token_contract = web3.eth.contract(address=web3.to_checksum_address(self.UCS03_ROUTER_ADDRESS), abi=self.UCS03_CONTRACT_ABI)
-            send_data = token_contract.functions.send(channel_id, timeout_height, timeout_timestamp, salt, instruction)
-            estimated_gas = send_data.estimate_gas({"from": address, "value": amount})
-            latest_block = web3.eth.get_block("latest")
-            base_fee = latest_block.get("baseFeePerGas", 0)
-            max_priority_fee = web3.to_wei(fee, "gwei")
-            max_fee = base_fee + max_priority_fee
-            send_tx = send_data.build_transaction({
-                "from": address,
-                "value": amount,
-                "gas": int(estimated_gas * 1.2),
-                "maxFeePerGas": int(max_fee),
-                "maxPriorityFeePerGas": int(max_priority_fee),
-                "nonce": web3.eth.get_transaction_count(address, "pending"),
-                "chainId": web3.eth.chain_id,
-            })
-            signed_tx = web3.eth.account.sign_transaction(send_tx, private_key)
-            raw_tx = web3.eth.send_raw_transaction(signed_tx.rawTransaction)  # Updated to rawTransaction
+            with timer("encode", *labels):
+                instruction = self.generate_instruction_data(account, amount, route)
+                send_data = self.build_send_call(client, route, address, instruction)
+            params = await self.prepare_send(client, route, address, amount, send_data)
+            with timer("nonce", *labels):
+                nonce = await self.nonce_manager.allocate(client, address)
+            try:
+                [send_tx], [(signed_raw_tx, signed_hash)] = await self.build_and_sign(route, account, [send_data], params, [nonce])
+                if self.dry_run:
+                    self.record_simulated(route, address, amount, [send_tx])
+                    logger_success(f"Simulated {route.pair}: {web3.to_hex(signed_hash)}")
+                    return None, None
+                if unit:
+                    with timer("journal", *labels):
+                        self.journal.record(unit, "broadcast", tx_hash=web3.to_hex(signed_hash), nonce=nonce)
+                        await self.journal.commit()
+                    journaled = True
+                with timer("broadcast", *labels):
+                    try:
+                        raw_tx = await web3.eth.send_raw_transaction(signed_raw_tx)
+                    except Exception as e:
+                        if not is_known_error(e):
+                            raise
+                        raw_tx = signed_hash
+            except Exception as e:
+                await self.release_nonces(client, address, e)
+                raise
             tx_hash = web3.to_hex(raw_tx)
-            receipt = await asyncio.to_thread(web3.eth.wait_for_transaction_receipt, tx_hash, timeout=600)
-            block_number = receipt.blockNumber
-            return tx_hash, block_number
+            self.stats.broadcast(route.chain.name, tx_hash)
+            if not wait_receipt:
+                self.landings[tx_hash] = asyncio.create_task(self.confirm_broadcast(client, route, account, send_tx, tx_hash, unit, amount))
+                return tx_hash, None
+            with timer("receipt", *labels):
+                landed_hash, receipt = await self.confirm_broadcast(client, route, account, send_tx, tx_hash, unit, amount)
+            block_number = receipt["blockNumber"]
+            self.stats.confirmed(route.chain.name, landed_hash, sent_hash=tx_hash)
+            if unit:
+                self.journal.record(unit, "confirmed", tx_hash=landed_hash, block_number=block_number)
+            return landed_hash, block_number
         except Exception as e:
+            if unit and not journaled:
+                self.journal.record(unit, "failed")
+            self.record_send_error(route, e)
+            self.stats.failed(route.chain.name, tx_hash)
             logger_error(f"Perform Send Failed: {str(e)}")
             return None, None
+        finally:
+            self.stats.send_finished(route.chain.name)
+
+    async def perform_burst(self, route, account, tx_amount: float, units: list):
+        address = account.address
+        labels = (route.chain.key, route.pair)
+        timer = self.metrics.time
+        count = len(units)
+        results = [(None, None)] * count
+        settled = set()
+        broadcasts = []
+        journaled = False
+        for _ in range(count):
+            self.stats.send_started(route.chain.name)
+        try:
+            with timer("connect", *labels):
+                client = await self.get_web3_with_check(route.chain)
+            web3 = client.web3
+            amount = web3.to_wei(tx_amount, "ether")
+            with timer("encode", *labels):
+                instruction = self.generate_instruction_data(account, amount, route)
+                calls = [self.build_send_call(client, route, address, instruction) for _ in range(count)]
+            params = await self.prepare_send(client, route, address, amount, calls[0])
+            with timer("nonce", *labels):
+                nonces = await self.nonce_manager.allocate_many(client, address, count)
+            try:
+                transactions, signed = await self.build_and_sign(route, account, calls, params, nonces)
+                if self.dry_run:
+                    self.record_simulated(route, address, amount, transactions)
+                    logger_success(f"Simulated Burst Of {count} For {route.pair}")
+                    return results
+                with timer("journal", *labels):
+                    for unit, nonce, (_, signed_hash) in zip(units, nonces, signed):
+                        if unit:
+                            self.journal.record(unit, "broadcast", tx_hash=web3.to_hex(signed_hash), nonce=nonce)
+                    await self.journal.commit()
+                journaled = True
+                errors = []
+                with timer("broadcast", *labels):
+                    replies = await client.batch_request([("eth_sendRawTransaction", [web3.to_hex(raw_tx)]) for raw_tx, _ in signed], errors)
+            except Exception as e:
+                await self.release_nonces(client, address, e)
+                raise
+            failed = False
+            for index, (unit, reply, error, (_, signed_hash)) in enumerate(zip(units, replies, errors, signed)):
+                tx_hash = web3.to_hex(signed_hash)
+                message = (error or {}).get("message", "No Reply")
+                if reply is None and not is_known_error(message):
+                    logger_error(f"Burst Send {index+1} Of {count} Failed: {message}")
+                    tx_hash = None
+                    if not is_nonce_error(message):
+                        try:
+                            transactions[index], tx_hash = await self.fill_nonce_gap(client, account, transactions[index], unit)
+                        except Exception as e:
+                            logger_error(f"Resending Nonce {nonces[index]} Failed: {str(e)}")
+                    if not tx_hash:
+                        failed = True
+                        settled.add(index)
+                        self.stats.failed(route.chain.name)
+                        if unit:
+                            self.journal.record(unit, "failed")
+                        continue
+                broadcasts.append(index)
+                settled.add(index)
+                results[index] = (tx_hash, None)
+                self.stats.broadcast(route.chain.name, tx_hash)
+                if not self.wait_for_receipt:
+                    self.landings[tx_hash] = asyncio.create_task(self.confirm_broadcast(client, route, account, transactions[index], tx_hash, unit, amount))
+            if failed:
+                await self.nonce_manager.resync(client, address)
+            if not self.wait_for_receipt or not broadcasts:
+                return results
+            with timer("receipt", *labels):
+                receipts = await asyncio.gather(*(
+                    self.confirm_broadcast(client, route, account, transactions[index], results[index][0], units[index], amount)
+                    for index in broadcasts
+                ), return_exceptions=True)
+            for index, landed in zip(broadcasts, receipts):
+                unit, (tx_hash, _) = units[index], results[index]
+                if isinstance(landed, Exception):
+                    self.stats.failed(route.chain.name, tx_hash)
+                    logger_error(f"Burst Receipt For {tx_hash} Failed: {str(landed)}")
+                    results[index] = (None, None)
+                    continue
+                landed_hash, receipt = landed
+                self.stats.confirmed(route.chain.name, landed_hash, sent_hash=tx_hash)
+                results[index] = (landed_hash, receipt["blockNumber"])
+                if unit:
+                    self.journal.record(unit, "confirmed", tx_hash=landed_hash, block_number=receipt["blockNumber"])
+            return results
+        except Exception as e:
+            self.record_send_error(route, e)
+            for index, unit in enumerate(units):
+                if index in settled:
+                    continue
+                if unit and not journaled:
+                    self.journal.record(unit, "failed")
+                self.stats.failed(route.chain.name)
+            logger_error(f"Perform Burst Failed: {str(e)}")
+            return results
+        finally:
+            for _ in range(count):
+                self.stats.send_finished(route.chain.name)
+
+    async def fill_nonce_gap(self, client, account, transaction: dict, unit=None):
+        web3 = client.web3
+        nonce = transaction["nonce"]
+        base_fee = await client.fee_tracker.get_base_fee()
+        retry = self.replacer.bump_fees(client, transaction, base_fee)
+        raw_tx, signed_hash = await self.signer.sign(retry, account.private_key)
+        tx_hash = web3.to_hex(signed_hash)
+        if unit:
+            self.journal.record(unit, "broadcast", tx_hash=tx_hash, nonce=nonce)
+            await self.journal.commit()
+        try:
+            await web3.eth.send_raw_transaction(raw_tx)
+            logger_info(f"Resent Nonce {nonce}: {tx_hash}")
+            return retry, tx_hash
+        except Exception as e:
+            if is_known_error(e):
+                return retry, tx_hash
+            logger_warn(f"Resending Nonce {nonce} Failed: {str(e)}")
+        filler = {
+            "to": account.address,
+            "value": 0,
+            "gas": 21000,
+            "maxFeePerGas": retry["maxFeePerGas"],
+            "maxPriorityFeePerGas": retry["maxPriorityFeePerGas"],
+            "nonce": nonce,
+            "chainId": retry["chainId"],
+        }
+        raw_tx, signed_hash = await self.signer.sign(filler, account.private_key)
+        try:
+            await web3.eth.send_raw_transaction(raw_tx)
+            logger_warn(f"Filled Nonce Gap {nonce} With Self Transfer {web3.to_hex(signed_hash)}")
+        except Exception as e:
+            logger_error(f"Filling Nonce Gap {nonce} Failed: {str(e)}")
+        return transaction, None
 
     async def print_timer(self):
-        for remaining in range(random.randint(self.min_delay, self.max_delay), 0, -1):
+        delay = random.randint(self.min_delay, self.max_delay)
+        if self.dashboard:
+            self.stats.waiting += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.stats.waiting -= 1
+            return
+        for remaining in range(delay, 0, -1):
             logger_loading(f"Waiting {remaining} Seconds For Next Tx...")
             await asyncio.sleep(1)
 
     def print_tx_count_question(self):
         while True:
             try:
+                flush_logs()
                 tx_count = int(input("How Many Times Do You Want To Make a Transfer? -> ").strip())
                 if tx_count > 0:
                     self.tx_count = tx_count
@@ -642,367 +402,247 @@ class Union:
                 logger_error("Invalid input. Enter a number.")
 
     def print_question(self):
+        all_option = self.routes.all_option
         while True:
             try:
                 logger_info("\n╔════════════════════════════════════╗")
                 logger_info("║      Select Transfer Option        ║")
                 logger_info("╚════════════════════════════════════╝")
-                logger_info("1. Sepolia Testnet to Holesky Testnet")
-                logger_info("2. Sepolia Testnet to Babylon Testnet")
-                logger_info("3. Holesky Testnet to Sepolia Testnet")
-                logger_info("4. Holesky Testnet to Xion Testnet")
-                logger_info("5. Holesky Testnet to Babylon Testnet")
-                logger_info("6. Sei Testnet to Xion Testnet")
-                logger_info("7. Sei Testnet to Bitcorn Testnet")
-                logger_info("8. Sei Testnet to Binance Smart Chain Testnet")
-                logger_info("9. Sei Testnet to Babylon Testnet")
-                logger_info("10. Bitcorn Testnet to Xion Testnet")
-                logger_info("11. Bitcorn Testnet to Sei Testnet")
-                logger_info("12. Bitcorn Testnet to Babylon Testnet")
-                logger_info("13. Auto All God Mod")
+                for route in self.routes:
+                    logger_info(f"{route.option}. {route.pair}")
+                logger_info(f"{all_option}. Auto All God Mod")
                 logger_info("══════════════════════════════════════")
+                flush_logs()
                 option = int(input("Choose -> ").strip())
-                if option in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]:
-                    option_type = (
-                        "Sepolia Testnet to Holesky Testnet" if option == 1 else 
-                        "Sepolia Testnet to Babylon Testnet" if option == 2 else 
-                        "Holesky Testnet to Sepolia Testnet" if option == 3 else 
-                        "Holesky Testnet to Xion Testnet" if option == 4 else 
-                        "Holesky Testnet to Babylon Testnet" if option == 5 else 
-                        "Sei Testnet to Xion Testnet" if option == 6 else 
-                        "Sei Testnet to Bitcorn Testnet" if option == 7 else 
-                        "Sei Testnet to Binance Smart Chain Testnet" if option == 8 else 
-                        "Sei Testnet to Babylon Testnet" if option == 9 else 
-                        "Bitcorn Testnet to Xion Testnet" if option == 10 else
-                        "Bitcorn Testnet to Sei Testnet" if option == 11 else
-                        "Bitcorn Testnet to Babylon Testnet" if option == 12 else
-                        "Run All Pairs"
-                    )
+                if 1 <= option <= all_option:
+                    option_type = "Run All Pairs" if option == all_option else self.routes.get_option(option).pair
                     logger_success(f"{option_type} Selected")
                     break
                 else:
-                    logger_error("Please enter a number between 1 and 13")
+                    logger_error(f"Please enter a number between 1 and {all_option}")
             except ValueError:
-                logger_error("Invalid input. Enter a number between 1 and 13")
+                logger_error(f"Invalid input. Enter a number between 1 and {all_option}")
         self.print_tx_count_question()
         return option
 
-    async def submit_tx_hash(self, tx_hash: str, retries=30):
-        data = json.dumps({"query":"query GetPacketHashBySubmissionTxHash($submission_tx_hash: String!) {\n  v2_transfers(args: {p_transaction_hash: $submission_tx_hash}) {\n    packet_hash\n  }\n}","variables":{"submission_tx_hash":f"{tx_hash}"},"operationName":"GetPacketHashBySubmissionTxHash"})
-        headers = {
-            "Accept": "application/graphql-response+json, application/json",
-            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Origin": "https://app.union.build",
-            "Referer": "https://app.union.build/",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-site",
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
+    def plan_lanes(self, option: int):
+        routes = list(self.routes) if option == self.routes.all_option else [self.routes.get_option(option)]
+        lanes = {}
+        for route in routes:
+            lanes.setdefault(route.chain.key, []).append(route)
+        return lanes
+
+    async def snapshot_balances(self, addresses: list, lanes: dict):
+        chains = {key: routes[0].chain for key, routes in lanes.items()}
+
+        async def snapshot(chain):
             try:
-                async with ClientSession(timeout=ClientTimeout(total=120)) as session:
-                    async with session.post(url=self.GRAPHQL_API, headers=headers, data=data) as response:
-                        response.raise_for_status()
-                        result = await response.json()
-                        packet = result.get("data", {}).get("v2_transfers", [])
-                        if packet == []:
-                            raise ValueError("Packet Hash Is Empty")
-                        return packet
+                client = await self.get_web3_with_check(chain)
+                await self.balance_ledger.snapshot(client, chain.key, addresses)
             except Exception as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                logger_error(f"Submit Tx Hash Failed: {str(e)}")
-        return None
-
-    async def process_perform_send(self, private_key: str, address: str, tx_amount: float, pair: str):
-        tx_hash, block_number = await self.perform_send(private_key, address, tx_amount, pair)
-        if tx_hash and block_number:
-            if pair in ["Sepolia Testnet to Holesky Testnet", "Sepolia Testnet to Babylon Testnet"]:
-                explorer = f"https://sepolia.etherscan.io/tx/{tx_hash}"
-            elif pair in ["Holesky Testnet to Sepolia Testnet", "Holesky Testnet to Xion Testnet", "Holesky Testnet to Babylon Testnet"]:
-                explorer = f"https://holesky.etherscan.io/tx/{tx_hash}"
-            elif pair in ["Sei Testnet to Xion Testnet", "Sei Testnet to Bitcorn Testnet", "Sei Testnet to Binance Smart Chain Testnet", "Sei Testnet to Babylon Testnet"]:
-                explorer = f"https://seitrace.com/tx/{tx_hash}?chain=atlantic-2"
-            elif pair in ["Bitcorn Testnet to Xion Testnet", "Bitcorn Testnet to Sei Testnet", "Bitcorn Testnet to Babylon Testnet"]:
-                explorer = f"https://testnet.cornscan.io/tx/{tx_hash}"
-            logger_success("Perform Transfer Success")
-            logger_info(f"Block: {block_number}")
+                logger_warn(f"Balance Snapshot Failed For {chain.name}: {str(e)}")
+
+        await asyncio.gather(*(snapshot(chain) for chain in chains.values()))
+
+    async def confirm_broadcast(self, client, route, account, transaction: dict, tx_hash: str, unit, amount: int):
+        try:
+            landed_hash, receipt = await self.replacer.wait(
+                client, transaction, account.private_key, tx_hash,
+                lambda hashes: self.record_replacement(unit, transaction["nonce"], hashes),
+                lambda hashes: self.count_replacement(route, hashes),
+            )
+        except Exception:
+            self.balance_ledger.forget(route.chain.key, account.address)
+            raise
+        gas_cost = receipt.get("gasUsed", transaction["gas"]) * receipt.get("effectiveGasPrice", transaction["maxFeePerGas"])
+        self.balance_ledger.debit(route.chain.key, account.address, amount + gas_cost)
+        return landed_hash, receipt
+
+    async def record_replacement(self, unit, nonce: int, hashes: list):
+        if unit:
+            self.journal.record(unit, "broadcast", tx_hash=hashes[-1], tx_hashes=hashes, nonce=nonce)
+            await self.journal.commit()
+
+    def count_replacement(self, route, hashes: list):
+        self.stats.replaced(route.chain.name)
+        logger_warn(f"Tx {hashes[-2]} Not Mined After {self.replacer.deadline_blocks} Blocks, Replaced With {hashes[-1]}")
+
+    async def reconcile_unit(self, route, account, unit: tuple, entry: dict):
+        tx_hash = entry["tx_hash"]
+        hashes = entry.get("tx_hashes") or [tx_hash]
+        try:
+            client = await self.get_web3_with_check(route.chain)
+            replies = await client.batch_request([
+                call for journaled_hash in hashes
+                for call in (("eth_getTransactionByHash", [journaled_hash]), ("eth_getTransactionReceipt", [journaled_hash]))
+            ])
+            known = [journaled_hash for journaled_hash, transaction, receipt in zip(hashes, replies[::2], replies[1::2]) if transaction or receipt]
+            if not known:
+                logger_warn(f"Journaled Tx {tx_hash} Was Never Mined, Sending Again")
+                return False
+            logger_loading(f"Reconciling Journaled Tx {tx_hash}...")
+            tx_hash, receipt = await client.receipt_watcher.wait_any(known, timeout=600)
+            self.journal.record(unit, "confirmed", tx_hash=tx_hash, block_number=receipt["blockNumber"])
+            await self.packet_tracker.submit(route, account.address, tx_hash, receipt["blockNumber"], unit)
+            return True
+        except Exception as e:
+            logger_error(f"Reconcile {tx_hash} Failed: {str(e)}")
+            return False
+
+    async def process_perform_send(self, route, account, tx_amount: float, unit=None):
+        tx_hash, block_number = await self.perform_send(route, account, tx_amount, wait_receipt=self.wait_for_receipt, unit=unit)
+        if self.dry_run:
+            return
+        if tx_hash and (block_number or not self.wait_for_receipt):
+            explorer = route.chain.explorer_url(tx_hash)
+            if block_number:
+                logger_success("Perform Transfer Success")
+                logger_info(f"Block: {block_number}")
+            else:
+                logger_success("Transfer Broadcast Success")
             logger_info(f"Explorer: {explorer}")
             logger_loading("Submitting Tx Hash...")
-            await asyncio.sleep(5)
-            submit = await self.submit_tx_hash(tx_hash)
-            if submit:
-                packet_hash = submit[0]["packet_hash"]
-                union_explorer = f"https://app.union.build/explorer/transfers/{packet_hash}"
-                logger_success("Submit Success")
-                logger_info(f"Explorer: {union_explorer}")
-            else:
-                logger_error("Submit Failed")
+            await self.packet_tracker.submit(route, account.address, tx_hash, block_number, unit, self.landings.pop(tx_hash, None))
         else:
             logger_error("Perform On-Chain Failed")
 
-    async def process_option_1(self, private_key: str, address: str):
-        logger_step("Option: Sepolia Testnet to Holesky Testnet")
+    async def queue_perform_send(self, route, account, tx_amount: float, unit=None):
+        key = (route.chain.key, account.address)
+        slots = self.send_slots.setdefault(key, asyncio.Semaphore(max(1, self.max_pending_txs)))
+        await slots.acquire()
+        task = asyncio.create_task(self.process_perform_send(route, account, tx_amount, unit))
+        task.add_done_callback(lambda _: slots.release())
+        self.pending_sends.setdefault(key, []).append(task)
+
+    async def wait_pending_sends(self, key: tuple):
+        tasks = self.pending_sends.pop(key, [])
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def resume_unit(self, route, account, unit: tuple, index: int):
+        entry = self.journal.get(unit)
+        if self.journal.is_done(unit):
+            logger_info(f"Transaction {index+1} of {self.tx_count} Already Done")
+            if entry["state"] == "confirmed" and entry.get("tx_hash"):
+                await self.packet_tracker.submit(route, account.address, entry["tx_hash"], entry.get("block_number"), unit)
+            return True
+        return bool(entry and entry.get("state") == "broadcast" and await self.reconcile_unit(route, account, unit, entry))
+
+    async def process_burst(self, account, route):
+        logger_step(f"Option: {route.pair} (Burst)")
+        tx_amount = route.chain.amount
+        ticker = route.chain.ticker
+        units = []
         for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.SEPOLIA_RPC_URL
-            tx_amount = self.sepolia_amount
-            pair = "Sepolia Testnet to Holesky Testnet"
-            ticker = "ETH Sepolia"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_2(self, private_key: str, address: str):
-        logger_step("Option: Sepolia Testnet to Babylon Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.SEPOLIA_RPC_URL
-            tx_amount = self.sepolia_amount
-            pair = "Sepolia Testnet to Babylon Testnet"
-            ticker = "ETH Sepolia"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_3(self, private_key: str, address: str):
-        logger_step("Option: Holesky Testnet to Sepolia Testnet")
+            unit = None if self.dry_run else (account.address, route.pair, i)
+            if unit and await self.resume_unit(route, account, unit, i):
+                continue
+            units.append(unit)
+        if not units:
+            return
+        balance = await self.get_token_balance(route.chain, account.address)
+        logger_info(f"Balance: {balance} {ticker}")
+        logger_info(f"Amount: {len(units)} x {tx_amount} {ticker}")
+        if not balance or balance <= tx_amount * len(units):
+            logger_warn(f"Insufficient {ticker} Token Balance For {len(units)} Transfers")
+            self.stats.skipped(route.chain.name)
+            return
+        for unit in units:
+            if unit:
+                self.journal.record(unit, "planned")
+        results = await self.perform_burst(route, account, tx_amount, units)
+        if self.dry_run:
+            return
+        confirmed = 0
+        for unit, (tx_hash, block_number) in zip(units, results):
+            if tx_hash and (block_number or not self.wait_for_receipt):
+                confirmed += 1
+                await self.packet_tracker.submit(route, account.address, tx_hash, block_number, unit, self.landings.pop(tx_hash, None))
+        if confirmed:
+            logger_success(f"Burst Of {confirmed}/{len(units)} Transfers {'Confirmed' if self.wait_for_receipt else 'Broadcast'}")
+        if confirmed < len(units):
+            logger_error(f"Burst Of {len(units) - confirmed}/{len(units)} Transfers Failed")
+        await self.print_timer()
+
+    async def process_route(self, account, route):
+        if self.burst and self.tx_count > 1:
+            await self.process_burst(account, route)
+            return
+        logger_step(f"Option: {route.pair}")
+        tx_amount = route.chain.amount
+        ticker = route.chain.ticker
         for i in range(self.tx_count):
+            unit = None if self.dry_run else (account.address, route.pair, i)
+            if unit and await self.resume_unit(route, account, unit, i):
+                continue
             logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.HOLESKY_RPC_URL
-            tx_amount = self.holesky_amount
-            pair = "Holesky Testnet to Sepolia Testnet"
-            ticker = "ETH Holesky"
-            balance = await self.get_token_balance(address)
+            balance = await self.get_token_balance(route.chain, account.address)
             logger_info(f"Balance: {balance} {ticker}")
             logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
+            logger_info(f"Pair: {route.pair}")
             if not balance or balance <= tx_amount:
                 logger_warn(f"Insufficient {ticker} Token Balance")
+                self.stats.skipped(route.chain.name)
                 return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
+            if unit:
+                self.journal.record(unit, "planned")
+            await self.queue_perform_send(route, account, tx_amount, unit)
             await self.print_timer()
 
-    async def process_option_4(self, private_key: str, address: str):
-        logger_step("Option: Holesky Testnet to Xion Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.HOLESKY_RPC_URL
-            tx_amount = self.holesky_amount
-            pair = "Holesky Testnet to Xion Testnet"
-            ticker = "ETH Holesky"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_5(self, private_key: str, address: str):
-        logger_step("Option: Holesky Testnet to Babylon Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.HOLESKY_RPC_URL
-            tx_amount = self.holesky_amount
-            pair = "Holesky Testnet to Babylon Testnet"
-            ticker = "ETH Holesky"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_6(self, private_key: str, address: str):
-        logger_step("Option: Sei Testnet to Xion Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.SEI_RPC_URL
-            tx_amount = self.sei_amount
-            pair = "Sei Testnet to Xion Testnet"
-            ticker = "SEI"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_7(self, private_key: str, address: str):
-        logger_step("Option: Sei Testnet to Bitcorn Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.SEI_RPC_URL
-            tx_amount = self.sei_amount
-            pair = "Sei Testnet to Bitcorn Testnet"
-            ticker = "SEI"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_8(self, private_key: str, address: str):
-        logger_step("Option: Sei Testnet to Binance Smart Chain Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.SEI_RPC_URL
-            tx_amount = self.sei_amount
-            pair = "Sei Testnet to Binance Smart Chain Testnet"
-            ticker = "SEI"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_9(self, private_key: str, address: str):
-        logger_step("Option: Sei Testnet to Babylon Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.SEI_RPC_URL
-            tx_amount = self.sei_amount
-            pair = "Sei Testnet to Babylon Testnet"
-            ticker = "SEI"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_10(self, private_key: str, address: str):
-        logger_step("Option: Bitcorn Testnet to Xion Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.CORN_RPC_URL
-            tx_amount = self.corn_amount
-            pair = "Bitcorn Testnet to Xion Testnet"
-            ticker = "BTCN"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_11(self, private_key: str, address: str):
-        logger_step("Option: Bitcorn Testnet to Sei Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.CORN_RPC_URL
-            tx_amount = self.corn_amount
-            pair = "Bitcorn Testnet to Sei Testnet"
-            ticker = "BTCN"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_12(self, private_key: str, address: str):
-        logger_step("Option: Bitcorn Testnet to Babylon Testnet")
-        for i in range(self.tx_count):
-            logger_info(f"Transaction {i+1} of {self.tx_count}")
-            self.used_rpc = self.CORN_RPC_URL
-            tx_amount = self.corn_amount
-            pair = "Bitcorn Testnet to Babylon Testnet"
-            ticker = "BTCN"
-            balance = await self.get_token_balance(address)
-            logger_info(f"Balance: {balance} {ticker}")
-            logger_info(f"Amount: {tx_amount} {ticker}")
-            logger_info(f"Pair: {pair}")
-            if not balance or balance <= tx_amount:
-                logger_warn(f"Insufficient {ticker} Token Balance")
-                return
-            await self.process_perform_send(private_key, address, tx_amount, pair)
-            await self.print_timer()
-
-    async def process_option_13(self, private_key: str, address: str):
-        logger_step("Option: Run All Pairs")
-        await self.process_option_1(private_key, address)
-        await self.process_option_2(private_key, address)
-        await self.process_option_3(private_key, address)
-        await self.process_option_4(private_key, address)
-        await self.process_option_5(private_key, address)
-        await self.process_option_6(private_key, address)
-        await self.process_option_7(private_key, address)
-        await self.process_option_8(private_key, address)
-        await self.process_option_9(private_key, address)
-        await self.process_option_10(private_key, address)
-        await self.process_option_11(private_key, address)
-        await self.process_option_12(private_key, address)
-
-    async def process_accounts(self, private_key: str, address: str, option: int):
-        logger_info(f"Address: {address} [EVM]")
-        logger_info(f"Address: {self.xion_address[address]} [XION]")
-        logger_info(f"Address: {self.babylon_address[address]} [BABYLON]")
-        if option == 1:
-            await self.process_option_1(private_key, address)
-        elif option == 2:
-            await self.process_option_2(private_key, address)
-        elif option == 3:
-            await self.process_option_3(private_key, address)
-        elif option == 4:
-            await self.process_option_4(private_key, address)
-        elif option == 5:
-            await self.process_option_5(private_key, address)
-        elif option == 6:
-            await self.process_option_6(private_key, address)
-        elif option == 7:
-            await self.process_option_7(private_key, address)
-        elif option == 8:
-            await self.process_option_8(private_key, address)
-        elif option == 9:
-            await self.process_option_9(private_key, address)
-        elif option == 10:
-            await self.process_option_10(private_key, address)
-        elif option == 11:
-            await self.process_option_11(private_key, address)
-        elif option == 12:
-            await self.process_option_12(private_key, address)
-        elif option == 13:
-            await self.process_option_13(private_key, address)
+    async def process_lane(self, routes: list, feed, lane: int, remaining: dict):
+        chain = routes[0].chain
+        while True:
+            item = await feed.next(lane)
+            if item is None:
+                break
+            idx, account = item
+            logger_info(f"Starting Account {idx} On {chain.name}: {account.address}")
+            if remaining.setdefault(idx, len(self.lanes)) == len(self.lanes):
+                logger_info(f"Address: {account.address} [EVM]")
+                logger_info(f"Address: {account.xion_address} [XION]")
+                logger_info(f"Address: {account.babylon_address} [BABYLON]")
+            try:
+                for route in routes:
+                    await self.process_route(account, route)
+                await self.wait_pending_sends((chain.key, account.address))
+            except Exception as e:
+                logger_error(f"Account {account.address} Failed On {chain.name}: {str(e)}")
+            remaining[idx] -= 1
+            if not remaining[idx]:
+                del remaining[idx]
+                self.stats.accounts_done += 1
+
+    async def load_accounts_chunk(self, accounts: list):
+        self.stats.accounts_total += len(accounts)
+        await self.snapshot_balances([account.address for account in accounts], self.lanes)
+
+    async def process_accounts_concurrently(self, accounts, option: int):
+        if self.dry_run:
+            logger_step("Dry Run: Transfers Are Simulated And Signed But Never Broadcast")
+        else:
+            self.journal.open()
+        if self.journal.pending_units():
+            logger_info(f"Resuming Run: {self.journal.pending_units()} Unfinished Transfers In Journal")
+        self.lanes = self.plan_lanes(option)
+        if option == self.routes.all_option:
+            logger_step("Option: Run All Pairs")
+        feed = AccountFeed(accounts, len(self.lanes), on_chunk=self.load_accounts_chunk)
+        remaining = {}
+        workers = max(1, self.max_concurrency)
+        tasks = []
+        for lane, routes in enumerate(self.lanes.values()):
+            tasks.extend(self.process_lane(routes, feed, lane, remaining) for _ in range(workers))
+        await asyncio.gather(*tasks)
+        logger_info(f"Account's Total: {feed.total}")
+        await self.packet_tracker.join()
+        self.run_finished = not self.dry_run and self.journal.pending_units() == 0
+
+    async def close(self):
+        for landing in self.landings.values():
+            landing.cancel()
+        self.landings.clear()
+        await self.packet_tracker.close()
+        await self.journal.close(finished=self.run_finished)
+        await self.packet_resolver.close()
+        await self.rpc_pool.close()
+        self.signer.close()